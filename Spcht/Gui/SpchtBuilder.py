@@ -37,9 +37,43 @@ import Spcht.Core.SpchtUtility as SpchtUtility
 import Spcht.Utils.local_tools as local_tools
 
 RESERVED_NAMES = [":ROOT:", ":UNUSED:", ":MAIN:"]
+# keys every exported node has to carry, filled with these defaults if missing
+_PURE_DEFAULTS = (('predicate', ''), ('source', 'dict'), ('field', ''), ('required', 'optional'))
 
 logger = logging.getLogger(__name__)
 
+_NODE_REFERENCES = frozenset(SpchtConstants.BUILDER_LIST_REFERENCE + SpchtConstants.BUILDER_SINGLE_REFERENCE)
+
+
+def _copy_plain(value):
+    """
+    Copies json like data, dictionaries and lists get rebuilt, immutable values are simply reused, anything else is
+    left to deepcopy. A lot faster than deepcopy for the plain data of a node as there is no memo to keep
+
+    :param any value: the data to copy
+    :return: an independent copy of value
+    """
+    if type(value) is dict:
+        return {key: _copy_plain(each) for key, each in value.items()}
+    if type(value) is list:
+        return [_copy_plain(each) for each in value]
+    if value is None or isinstance(value, (str, int, float)):  # bool is an int
+        return value
+    return copy.deepcopy(value)
+
+
+def _copy_node(node):
+    """
+    Copies a SimpleSpchtNode so its keys and parent can change independently, the values are the same objects
+
+    :param SimpleSpchtNode node: any node
+    :return: a shallow copy with its own properties
+    :rtype: SimpleSpchtNode
+    """
+    twin = copy.copy(node)
+    twin.properties = dict(node.properties)
+    return twin
+
 
 class SimpleSpchtNode:
 
@@ -345,6 +379,21 @@ class SpchtBuilder:
         self._repository[new_name] = new_node
         return new_name
 
+    def fork(self):
+        """
+        Creates a copy of the builder that can be modified without touching this one, used to try out an altered node
+        before it is actually saved. Only the nodes themselves are copied, their values are shared as the builder
+        only ever replaces values of a node and never changes them in place, a lot cheaper than a deepcopy of it all
+
+        :return: an independent builder with the same nodes
+        :rtype: SpchtBuilder
+        """
+        forked = copy.copy(self)
+        forked._repository = {name: _copy_node(node) for name, node in self._repository.items()}
+        forked.root = _copy_node(self.root)
+        forked._names = copy.copy(self._names)  # handing out names of the fork does not use up the ones in here
+        return forked
+
     def modify(self, OriginalName: str, UniqueSpchtNode: SimpleSpchtNode):
         """
         Modifies a node in the repository with a new Node. The actual new name if changed might be different from
@@ -609,7 +658,10 @@ class SpchtBuilder:
         node_list = []
         for key, top_node in self.items():
             if top_node.parent == parent:
-                one_node = self.compileNode(key, always_inherit, purity=purity)
+                if purity and not always_inherit:
+                    one_node = self._compile_pure(key)
+                else:
+                    one_node = self.compileNode(key, always_inherit, purity=purity)
                 if mode == "reckless":
                     node_list.append(one_node)
                 else:
@@ -680,6 +732,35 @@ class SpchtBuilder:
             pure_dict.pop('name', None)
         return pure_dict
 
+    def _compile_pure(self, name: str):
+        """
+        Specialised version of compileNode for the export path (purity=True, always_inherit=False, anon=False)
+
+        *the export compiles every single node, the generic version carries a lot of branches that always go the same
+        way in that case. As 'predicate_inheritance' never makes it into the compiled dictionary and always_inherit is
+        off the whole predicate inheritance block cannot change anything, therefore its skipped entirely*
+
+        :param str name: name of the node that is to be compiled
+        :return: a dictionary that represents a single node..with children, ready for a spcht.json
+        :rtype: dict
+        """
+        name = str(name)
+        node = self._repository.get(name)
+        if node is None:
+            return None
+        pure_dict = {}
+        for key, item in node.properties.items():
+            if key in SpchtConstants.BUILDER_LIST_REFERENCE:  # sub_nodes & sub_data
+                pure_dict[key] = [self._compile_pure(child_name) for child_name in self.getNodeNamesByParent(item)]
+            elif key in SpchtConstants.BUILDER_SINGLE_REFERENCE:
+                pure_dict[key] = self._compile_pure(item)
+            elif key not in SpchtConstants.BUILDER_NON_SPCHT:
+                pure_dict[key] = item
+        for high_key, default_val in _PURE_DEFAULTS:
+            if high_key not in pure_dict:
+                pure_dict[high_key] = default_val
+        return pure_dict
+
     def inheritPredicate(self, sub_node_name: str):
         """
         Manually inherits the predicate of a parent..if that node actually got a parent from which it can inherit
@@ -854,7 +935,11 @@ class SpchtBuilder:
         Uses the solved referenced inside the spcht builder to resolve the relative file paths provided by the
         given node. This works with arbitary nodes and is not limited to the Nodes inside the builder
         """
-        node2 = copy.deepcopy(node)
+        if type(node) is dict:
+            # * references get compiled and replaced below, copying them here too would copy every level once per ancestor
+            node2 = {key: value if key in _NODE_REFERENCES else _copy_plain(value) for key, value in node.items()}
+        else:
+            node2 = copy.deepcopy(node)
         if 'mapping_settings' in node and '$ref' in node['mapping_settings']:
             map0 = node.get('mapping', {})
             map1 = self.resolveReference(node['mapping_settings']['$ref'])
@@ -912,7 +997,7 @@ class SpchtBuilder:
         :return:
         :rtype:
         """
-        return [key for key in self]  # is this not the same as self.keys()?
+        return list(self._repository)
 
     def getChildlessParents(self):
         """
@@ -921,7 +1006,7 @@ class SpchtBuilder:
         :return: list of all nodes without fallback
         :rtype: list
         """
-        return [x for x in self if 'fallback' not in self[x]]
+        return [name for name, node in self._repository.items() if 'fallback' not in node]
 
     def getSubnodeParents(self):
         """
@@ -22,13 +22,42 @@
 # @license GPL-3.0-only <https://www.gnu.org/licenses/gpl-3.0.en.html>
 
 import json
-import re
-import codecs
+import csv
+import itertools
+import mmap
+import os
+import sys
 from collections import defaultdict
 import logging
+try:
+    import orjson as fast_json  # considerably faster parsing, works on bytes
+except ModuleNotFoundError:
+    fast_json = json  # stdlib json.loads also accepts bytes
 
 logger = logging.getLogger(__name__)
 
+MMAP_THRESHOLD = 4096  # files smaller than a page are simply read, mapping them costs more than it saves
+
+
+def load_json_mapped(file_path) -> object:
+    """
+    Reads a json file by mapping it into memory instead of copying it through a file buffer first, small files are
+    read directly
+
+    :param str or Path file_path: path to a json file
+    :return: the decoded json content
+    :raises json.JSONDecodeError: if the content is not valid json, this includes empty files
+    :raises FileNotFoundError: if there is no such file
+    """
+    with open(file_path, "rb") as json_file:
+        if os.fstat(json_file.fileno()).st_size < MMAP_THRESHOLD:  # also covers empty files that cannot be mapped
+            return fast_json.loads(json_file.read())
+        with mmap.mmap(json_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if fast_json is json:  # the stdlib parser wants actual bytes
+                return json.loads(mapped[:])
+            with memoryview(mapped) as view:
+                return fast_json.loads(view)
+
 
 class Spcht_i18n:
     """
@@ -49,52 +78,88 @@ class Spcht_i18n:
     }
     ```
     """
+    # loaded packages shared by all instances,
+    # (absolute path, mtime) -> (raw dictionary, {language: translations}, {language: number of translatable keys})
+    __packages = {}
+    __packages_size = 8
 
     def __init__(self, file_path, language="en"):
-        self.__language = language
-        self.__default_language = "en"
+        self.__language = sys.intern(language)
+        self.__default_language = sys.intern("en")
+        self.__raw = {}  # the untouched language file, keys get resolved on first access
         self.__repository = {}
+        self.__length = 0  # keys with a text in this or the default language, the package never changes once loaded
         self.__load_package(file_path)
 
     def __repr__(self):
-        return f"SPCHT_i18n [{self.__language}] {len(self.__repository)}"
+        return f"SPCHT_i18n [{self.__language}] {len(self)}"
 
     def __contains__(self, item):
-        if item in self.__repository:
-            return True
-        else:
-            return False
+        return item in self.__repository or self.__resolve(item) is not None
 
     def __len__(self):
-        return len(self.__repository)
+        return self.__length
 
     def __getitem__(self, item):
-        if item in self.__repository:
+        try:
             return self.__repository[item]
+        except KeyError:
+            return self.__resolve(item, item)  # unknown keys echo themselves
+
+    def __resolve(self, item, fallback=None):
+        """
+        Translates a key that was not yet asked for and remembers the result for every following lookup
+
+        :param str item: key of the language file
+        :param any fallback: returned if there is no translation for the key
+        :return: the translation in the current or default language
+        :rtype: str
+        """
+        value = self.__raw.get(item)
+        if type(value) is not dict:  # json never yields dict subclasses
+            return fallback
+        lang, default = self.__language, self.__default_language
+        if lang in value:
+            translation = value[lang]
+        elif default in value:
+            translation = value[default]
         else:
-            return item
+            return fallback
+        if type(translation) is str and len(translation) < 64:  # short labels repeat a lot, "OK", "Cancel"..
+            translation = sys.intern(translation)
+        self.__repository[sys.intern(item)] = translation
+        return translation
 
     def __load_package(self, file_path):
         try:
-            with open(file_path, "r") as language_file:
-                language_dictionary = json.load(language_file)
-        except json.JSONDecodeError as decoder:
+            file_stat = os.stat(file_path)
+            if file_stat.st_size == 0:
+                logger.warning(f"Given language file is empty")
+                return False
+            # a changed file has a new mtime and therefore just misses the cache
+            cache_key = (os.path.abspath(file_path), file_stat.st_mtime_ns)
+            if cache_key not in Spcht_i18n.__packages:
+                language_dictionary = load_json_mapped(file_path)
+                if not isinstance(language_dictionary, dict):
+                    return False
+                if len(Spcht_i18n.__packages) >= Spcht_i18n.__packages_size:  # dicts are ordered, first is oldest
+                    Spcht_i18n.__packages.pop(next(iter(Spcht_i18n.__packages)))
+                Spcht_i18n.__packages[cache_key] = (language_dictionary, {}, {})
+        except json.JSONDecodeError as decoder:  # orjson.JSONDecodeError is a subclass of this
             logger.warning(f"Could not load json because error: {decoder}")
             return False
         except FileNotFoundError:
             logger.warning(f"Could not locate given language file")
             return False
 
-        if not isinstance(language_dictionary, dict):
-            return False
-
-        for key, value in language_dictionary.items():
-            if not isinstance(value, dict):
-                continue
-            if self.__language in value:
-                self.__repository[key] = value[self.__language]
-            elif self.__default_language in value:
-                self.__repository[key] = value[self.__default_language]
+        self.__raw, translations, lengths = Spcht_i18n.__packages[cache_key]
+        # instances of the same language resolve every key the same way and can share their results
+        self.__repository = translations.setdefault(self.__language, {})
+        if self.__language not in lengths:  # counted once per language and package
+            lang, default = self.__language, self.__default_language
+            lengths[lang] = sum(1 for value in self.__raw.values()
+                                if type(value) is dict and (lang in value or default in value))
+        self.__length = lengths[self.__language]
 
     @staticmethod
     def export_csv(language_file: str, csv_file: str, separator=";"):
@@ -106,10 +171,8 @@ class Spcht_i18n:
         :return: True if everything went alright, False and a log file entry if something went wrong
         :rtype: bool
         """
-        # yes, there is a library for csv writing, i acknowledge that
         try:
-            with open(language_file, "r") as languages:
-                pure_data = json.load(languages)
+            pure_data = load_json_mapped(language_file)
         except FileNotFoundError:
             logger.error(f"Could not find language file '{language_file}' for export to csv")
             return False
@@ -117,19 +180,13 @@ class Spcht_i18n:
             logger.error(f"While trying to export, reading in the language file {language_file} failed with a json error {e}")
             return False
         try:
-            with open(csv_file, "w") as csv:
-                languages = defaultdict(int)
-                for each in pure_data.values():
-                    for key in each:
-                        languages[key] += 1
-                print(str(dict(languages)))
-                fixed_order = set(languages.keys())
-                csv.write(f"{separator}{';'.join(fixed_order)}\n")
-                for key, item in pure_data.items():
-                    csv.write(f"{key}")
-                    for lang in fixed_order:
-                        csv.write(f"{separator}{item.get(lang, '')}")
-                    csv.write("\n")
+            with open(csv_file, "w", encoding="utf-8", newline="") as csv_handle:
+                # sorted so the header and every row share the very same, reproducible order
+                fixed_order = sorted({lang for each in pure_data.values() for lang in each})
+                writer = csv.writer(csv_handle, delimiter=separator, lineterminator="\n")
+                header = [[""] + fixed_order]
+                rows = ([key] + [item.get(lang, '') for lang in fixed_order] for key, item in pure_data.items())
+                writer.writerows(itertools.chain(header, rows))
         except FileExistsError as e:
             logger.error(f"File already exists, cannot overwrite '{csv_file}' - {e}")
             return False
@@ -137,27 +194,24 @@ class Spcht_i18n:
 
     @staticmethod
     def import_csv(csv_file: str, language_file: str, seperator=";"):
+        translation = defaultdict(dict)
         try:
-            with codecs.open(csv_file, "r", encoding="utf-8") as csv:
-                all_lines = csv.readlines()
+            with open(csv_file, "r", encoding="utf-8", newline="", buffering=1 << 20) as csv_handle:
+                reader = csv.reader(csv_handle, delimiter=seperator)
+                header = next(reader, [])
+                lang = {i: x for i, x in enumerate(header) if i > 0}
+                # every element except the first as a dictionary
+                for data in reader:
+                    if not data:
+                        continue
+                    row = translation[data[0]]
+                    for i in range(1, len(data)):
+                        row[lang[i]] = data[i]
         except FileNotFoundError:
             logger.error(f"Cannot find designated file {csv_file}")
             return False
-        lang = {_: re.sub(r"(\n$)|(\r$)|(\n\r$)", "", x) for _, x in enumerate(all_lines[0].split(seperator)) if _ > 0}
-        print(lang)
-        translation = defaultdict(dict)
-        # every element except the first as a dictionary
-        for _, line in enumerate(all_lines):
-            if _ == 0:  # this construct seems like something i could do better
-                continue
-            data = line.split(seperator)
-            for i, each in enumerate(data):
-                if i == 0:
-                    continue
-                translation[data[0]][lang[i]] = re.sub(r"(\n$)|(\r$)|(\n\r$)", "", each)
         try:
-            with codecs.open(language_file, "w", encoding='utf-8') as languages:
+            with open(language_file, "w", encoding="utf-8", buffering=1 << 20) as languages:
                 json.dump(translation, languages, indent=3, ensure_ascii=False)
-                print(f"Entries: {len(translation)}")
         except FileExistsError:
             logger.warning(f"File {language_file} already exists and cannot be overwritten")
\ No newline at end of file
@@ -26,12 +26,20 @@ __appname__ = "SpchtCheckerBuilderGui"
 __appauthor__ = "UniversityLeipzig"
 __version__ = "0.8"
 
+import bisect
 import json
 import logging
 import sys
 import os
 import time
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+try:
+    import orjson  # serializes several times faster than the stdlib, only knows an indent of two
+except ModuleNotFoundError:
+    orjson = None
 
 from PySide2.QtGui import QStandardItemModel, QStandardItem, QFontDatabase, QIcon, QSyntaxHighlighter, QTextCharFormat, QColor, QFont, QTextDocument, QPalette
 from PySide2.QtWidgets import *
@@ -41,7 +49,8 @@ from PySide2 import QtCore, QtWidgets
 
 import Spcht.Gui.SpchtCheckerGui_i18n as SpchtCheckerGui_18n
 import Spcht.Utils.SpchtConstants as SpchtConstants
-from Spcht.Gui.SpchtBuilder import SimpleSpchtNode
+if TYPE_CHECKING:
+    from Spcht.Gui.SpchtBuilder import SimpleSpchtNode
 
 
 def resource_path(relative_path: str) -> str:
@@ -57,23 +66,104 @@ def resource_path(relative_path: str) -> str:
     return os.path.join(base_path, relative_path)
 
 
+@lru_cache(maxsize=None)
+def _std_icon(pixmap: QStyle.StandardPixmap) -> QIcon:
+    """
+    Shared standard icon of the current application style, QIcons are implicitly shared so handing out the same
+    one to every button is fine and saves asking the style engine each time
+    :param pixmap: one of the QStyle.SP_* enums
+    :return: the icon for that enum
+    :rtype: QIcon
+    """
+    return QApplication.style().standardIcon(pixmap)
+
+
+def pretty_json(data) -> str:
+    """
+    Indented json text of data for display, with orjson if it is installed and the stdlib otherwise
+
+    :param dict or list data: anything json can serialize
+    :return: human readable json
+    :rtype: str
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, indent=3)
+
+
 # ! import language stuff
 #i18n = SpchtCheckerGui_18n.Spcht_i18n(resource_path("./Gui/GuiLanguage.json"), language='en')
-i18n = SpchtCheckerGui_18n.Spcht_i18n(Path(__file__).parent / "GuiLanguage.json", language='en')
+class _LazyI18n:
+    """
+    Stand-in for Spcht_i18n that only reads the language file once the first text is actually asked for, importing
+    this module for a dialogue or a type hint therefore costs no json parsing
+    """
+    def __init__(self, file_path, language="en"):
+        self._file_path = file_path
+        self._language = language
+        self._i18n = None
+        self._lookup = self._first_lookup  # replaced by the real __getitem__ once loaded
+
+    def _load(self) -> SpchtCheckerGui_18n.Spcht_i18n:
+        if self._i18n is None:
+            self._i18n = SpchtCheckerGui_18n.Spcht_i18n(self._file_path, language=self._language)
+        return self._i18n
+
+    def _first_lookup(self, item):
+        self._lookup = self._load().__getitem__
+        return self._lookup(item)
+
+    def __getitem__(self, item):
+        return self._lookup(item)  # the gui asks for hundreds of labels, one call straight through, no checks
+
+    def __contains__(self, item):
+        return item in self._load()
+
+    def __len__(self):
+        return len(self._load())
+
+    def __repr__(self):
+        return repr(self._load())
+
+
+i18n = _LazyI18n(Path(__file__).parent / "GuiLanguage.json", language='en')
 
 
 class SpchtMainWindow(object):
+    _tree_headers = None
+    # supported properties of massSetProperty and their setters, sizes come as (width, height)
+    _mass_setters = {'maximumHeight': 'setMaximumHeight', 'maximumWidth': 'setMaximumWidth',
+                     'maximumSize': 'setMaximumSize', 'minimumHeight': 'setMinimumHeight',
+                     'minimumWidth': 'setMinimumWidth', 'minimumSize': 'setMinimumSize',
+                     'fixedHeight': 'setFixedHeight', 'fixedWidth': 'setFixedWidth', 'fixedSize': 'setFixedSize',
+                     'sizePolicy': 'setSizePolicy', 'alignment': 'setAlignment',
+                     'disabled': 'setDisabled', 'enabled': 'setEnabled'}
+    _mass_sizes = frozenset(('maximumSize', 'minimumSize', 'fixedSize'))
+    _sparql_headers = ("resource identifier", "property name", "property value")
+
+    @classmethod
+    def _header_labels(cls) -> tuple:
+        """
+        Translated column headers of the spcht treeview, the language does not change at runtime so they are
+        only looked up for the first window
+        :return: the six column names
+        :rtype: tuple
+        """
+        if cls._tree_headers is None:
+            cls._tree_headers = tuple(i18n[key] for key in ('generic_name', 'generic_predicate', 'generic_source',
+                                                            'generic_objects', 'generic_info', 'generic_comments'))
+        return cls._tree_headers
 
     def create_ui(self, MainWindow: QMainWindow):
         self.time0 = time.time()
-        self.FIXEDFONT = self.FIXEDFONT = tryForFont(9)
+        self.FIXEDFONT = tryForFont(9)
         self.console = QTextEdit(ReadOnly=True, Font=self.FIXEDFONT)
         # console elements gets created out of bounds so i can write to it despite it not beeing yet in layout
         self.loadUserSettings()
 
-        self.input_timer = QtCore.QTimer()
-        self.input_timer.setSingleShot(True)
-        self.spcht_timer = QtCore.QTimer(SingleShot=True)
+        # debounce timers, every start() restarts them so a burst of edits ends in a single timeout
+        self.input_timer = QtCore.QTimer(SingleShot=True, Interval=2000)
+        self.spcht_timer = QtCore.QTimer(SingleShot=True, Interval=1000)
 
         self.policy_minimum_expanding = QSizePolicy()
         self.policy_minimum_expanding.Policy = QSizePolicy.MinimumExpanding
@@ -90,12 +180,15 @@ class SpchtMainWindow(object):
         self.central_widget = QStackedWidget()
         self.setCentralWidget(self.central_widget)
 
+        # QIcons are implicitly shared, one instance per pixmap is enough for any number of buttons
+        reload_icon = _std_icon(QStyle.SP_BrowserReload)
+
         # left side
         top_file_bar = QHBoxLayout()
         self.linetext_spcht_filepath = QLineEdit(PlaceholderText=i18n['str_sdf_file_placeholder'], ReadOnly=True)
         # self.btn_create_spcht = QPushButton(i18n['btn_create_spcht'])
         self.btn_load_spcht_file = QPushButton(i18n['btn_sdf_txt'])
-        self.btn_load_spcht_retry = QPushButton(i18n['generic_retry'], Disabled=True, icon=QApplication.style().standardIcon(QStyle.SP_BrowserReload))
+        self.btn_load_spcht_retry = QPushButton(i18n['generic_retry'], Disabled=True, icon=reload_icon)
         top_file_bar.addWidget(self.linetext_spcht_filepath)
         # top_file_bar.addWidget(self.btn_create_spcht)
         top_file_bar.addWidget(self.btn_load_spcht_file)
@@ -105,7 +198,7 @@ class SpchtMainWindow(object):
         self.str_testdata_filepath = QLineEdit(PlaceholderText=i18n['str_jsonfile_placeholder'], ReadOnly=True)
         self.linetext_subject_prefix = QLineEdit(PlaceholderText=i18n['str_subject_placeholder'], ReadOnly=True, MaximumWidth=250)
         self.btn_load_testdata_file = QPushButton(i18n['btn_testdata_txt'], ToolTip=i18n['btn_testdata_tooltip'], Disabled=True)
-        self.btn_load_testdata_retry = QPushButton(i18n['generic_retry'], ToolTip=i18n['btn_retry_tooltip'], Disabled=True, icon=QApplication.style().standardIcon(QStyle.SP_BrowserReload))
+        self.btn_load_testdata_retry = QPushButton(i18n['generic_retry'], ToolTip=i18n['btn_retry_tooltip'], Disabled=True, icon=reload_icon)
         bottom_file_bar.addWidget(self.str_testdata_filepath)
         bottom_file_bar.addWidget(self.linetext_subject_prefix)
         bottom_file_bar.addWidget(self.btn_load_testdata_file)
@@ -119,9 +212,7 @@ class SpchtMainWindow(object):
         self.btn_tree_collapse = QPushButton(i18n['generic_collapseall'], Flat=True, FixedHeight=15)
         self.treeview_main_spcht_data = QTreeView()
         self.spchttree_view_model = QStandardItemModel()
-        self.spchttree_view_model.setHorizontalHeaderLabels(
-            [i18n['generic_name'], i18n['generic_predicate'], i18n['generic_source'], i18n['generic_objects'],
-             i18n['generic_info'], i18n['generic_comments']])
+        self.spchttree_view_model.setHorizontalHeaderLabels(SpchtMainWindow._header_labels())
         self.treeview_main_spcht_data.setModel(self.spchttree_view_model)
         self.treeview_main_spcht_data.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.treeview_main_spcht_data.setUniformRowHeights(True)
@@ -157,7 +248,7 @@ class SpchtMainWindow(object):
         self.tbl_tabview.horizontalHeader().setStretchLastSection(True)
         self.tbl_tabview.horizontalHeader().setSectionsClickable(False)
         self.mdl_tbl_sparql = QStandardItemModel()
-        self.mdl_tbl_sparql.setHorizontalHeaderLabels(["resource identifier", "property name", "property value"])
+        self.mdl_tbl_sparql.setHorizontalHeaderLabels(SpchtMainWindow._sparql_headers)
         self.tbl_tabview.setModel(self.mdl_tbl_sparql)
         self.tbl_tabview.setColumnWidth(0, 300)
         self.tbl_tabview.setColumnWidth(1, 300)
@@ -182,9 +273,7 @@ class SpchtMainWindow(object):
         bottombar.addWidget(self.btn_tristate)
         bottombar.addWidget(self.btn_change_main)
         bottombar.addWidget(self.notifybar)
-        randombarasWidget = QWidget()
-        randombarasWidget.setLayout(bottombar)
-        self.bottomStack.addWidget(randombarasWidget)
+        self.bottomStack.addWidget(lay2widget(bottombar))
         self.bottomStack.addWidget(self.processBar)
 
         # * explorer layout
@@ -192,10 +281,8 @@ class SpchtMainWindow(object):
 
         # general layouting
         self.MainPageLayout = QStackedWidget()
-        randomStackasWidget = QWidget()
-        randomStackasWidget.setLayout(center_layout)
         self.MainPageLayout.addWidget(self.console)
-        self.MainPageLayout.addWidget(randomStackasWidget)
+        self.MainPageLayout.addWidget(lay2widget(center_layout))
         self.MainPageLayout.addWidget(tabView)
 
         checker_layout.addLayout(top_file_bar, 0, 0)
@@ -210,8 +297,14 @@ class SpchtMainWindow(object):
         self.console.insertPlainText(f"Building of interface took {time.time()-self.time0:.2f} seconds\n")
 
     def create_explorer_layout(self):
+        # shared like the reload icon in create_ui
+        open_icon = _std_icon(QStyle.SP_DialogOpenButton)
+        save_icon = _std_icon(QStyle.SP_DialogSaveButton)
+
         self.field_completer = QCompleter()
         self.field_completer.setCaseSensitivity(QtCore.Qt.CaseSensitive)
+        self.field_completer_model = QtCore.QStringListModel(self.field_completer)  # field names of the loaded data
+        self.field_completer.setModel(self.field_completer_model)
 
         self.explorer = QWidget()
         self.explore_main_vertical = QVBoxLayout(self.explorer)
@@ -221,9 +314,8 @@ class SpchtMainWindow(object):
 
         # ? navigation of compiled data
         self.explorer_middle_nav_layout = QHBoxLayout()
-        self.explorer_mid_nav_dummy = QWidget()
+        self.explorer_mid_nav_dummy = lay2widget(self.explorer_middle_nav_layout)  # only there to cap the width
         self.explorer_mid_nav_dummy.setMaximumWidth(400)
-        self.explorer_mid_nav_dummy.setLayout(self.explorer_middle_nav_layout)
         #self.explorer_left_horizontal_spacer = QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Minimum)
         #self.explorer_right_horizontal_spacer = QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Minimum)
         self.explorer_leftleft_button = QPushButton("<<")
@@ -284,9 +376,7 @@ class SpchtMainWindow(object):
         self.explorer_field_filter.setPlaceholderText(i18n['linetext_field_filter_placeholder'])
         self.explorer_filter_behaviour = QCheckBox(i18n['check_blacklist_behaviour'], Checked=self.save_blacklist)
         if self.save_field_filter is None:
-            self.explorer_field_filter.setText("spelling, barcode, rvk_path, rvk_path_str_mv, topic_facet, author_facet, institution, spellingShingle")
-            # extended version for solr of the ubl, whom it might concern
-            # _version_, access_facet_,author_corporate,author_corporate_role,author_sort,author_variant,barcode,barcode_de15,barcode_dech1,barcode_del152,barcode_dezi4,branch_de14,branch_de15, branch_dezi4,building,callnumber-first,callnumber-label,callnumber-raw,callnumber-search,callnumber-subject,callnumber_de14,callnumber_de15,callnumber-sort,callnumber_de15_cns_mv,callnumber_de15_ct_mv,callnumber_dech1,callnumber_del152,branch_dech1,callnumber_dezi4,collcode_dech1,collcode_dezi4,container_reference,ctrlnum,container_start_page,container_title,contents,dateSpan,de15_date,dech1_date,dewey-full,dewey-hundreds,dewey-ones,dewey-raw,dewey-sort,dewey-tens,dewey-search,era_facet,facet_912a, facet_avail,facet_de14_branch_collcode_exception,facet_local_del330, facet_scale,film_heading,finc_id_str,format_de105,format_de14, format_de15,format_del152,format_dezi4,format_finc,format_legacy_nrw,format_nrw,genre_facet,geogr_code,geogr_code_person, hierarchy_sequence, is_hierarchy_id, is_hierarchy_title, local_class_del242,local_heading_facet_dezwi2,marc028a_ct_mv,match_str,mega_collection,misc_de105,multipart_link,marc024a_ct_mv,multipart_part,multipart_set,names_id_str_mv, spelling,spellingShingle, rvk_path, rvk_path_str_mv,title_full_unstemmed, title_in_hierarchy,title_list_str,title_id_str_mv, zdb, urn, topic_facet,title_old, title_orig, title_part_str, title_short, title_sort
+            self.explorer_field_filter.setText(SpchtConstants.DEFAULT_EXPLORER_FIELD_FILTER)
         else:
             self.explorer_field_filter.setText(self.save_field_filter)
         # additional widgets here
@@ -296,8 +386,8 @@ class SpchtMainWindow(object):
         self.explorer_top_layout.addWidget(self.explorer_filter_behaviour)
         # self.explore_main_vertical.addLayout(self.explorer_top_layout)
         self.explorer_data_file_path = QLineEdit(ReadOnly=True)
-        self.explorer_data_solr_button = QPushButton(i18n['load_solr'], icon=QApplication.style().standardIcon(QStyle.SP_DriveNetIcon))
-        self.explorer_data_load_button = QPushButton(i18n['generic_load'], icon=QApplication.style().standardIcon(QStyle.SP_DialogOpenButton))
+        self.explorer_data_solr_button = QPushButton(i18n['load_solr'], icon=_std_icon(QStyle.SP_DriveNetIcon))
+        self.explorer_data_load_button = QPushButton(i18n['generic_load'], icon=open_icon)
         ver_layout_18 = QVBoxLayout(self.explorer_toolbox_page0)
         hor_layout_20 = QHBoxLayout()
         hor_layout_20.addWidget(self.explorer_data_file_path)
@@ -305,12 +395,9 @@ class SpchtMainWindow(object):
         hor_layout_20.addWidget(self.explorer_data_load_button)
         hor_layout_21 = QHBoxLayout()
         self.explorer_dictionary_treeview = QTreeView()
-        self.explorer_arbitrary_data = QTextEdit(Hidden=True, Font=self.FIXEDFONT)  # arbitrary
-        bla = self.explorer_arbitrary_data.palette()  # copies palette with current design
-        bla.setColor(QPalette.Window, QColor.fromRgb(251, 241, 199))
-        bla.setColor(QPalette.WindowText, QColor.fromRgb(60, 131, 54))
-        self.explorer_arbitrary_data.setPalette(bla)  # and copies it back after some changes
-        JsonHighlighter(self.explorer_arbitrary_data.document())
+        self.explorer_dictionary_model = QStandardItemModel()  # refilled for every data set and filter change
+        self.explorer_dictionary_treeview.setModel(self.explorer_dictionary_model)
+        self.explorer_arbitrary_data = _JsonArbitraryEdit(Hidden=True, Font=self.FIXEDFONT)  # arbitrary
         hor_layout_21.addWidget(self.explorer_dictionary_treeview)
         hor_layout_21.addWidget(self.explorer_arbitrary_data)
         ver_layout_18.addLayout(self.explorer_top_layout)
@@ -321,16 +408,16 @@ class SpchtMainWindow(object):
         ver_layout_23 = QVBoxLayout(self.explorer_toolbox_page1)
         hor_layour_22 = QHBoxLayout()
         hor_layour_23 = QHBoxLayout()
-        self.explorer_node_add_btn = QPushButton(i18n['explorer_new_node'], FixedWidth=150, icon=QApplication.style().standardIcon(QStyle.SP_FileDialogNewFolder))
-        self.explorer_node_create_btn = QPushButton(i18n['explorer_new_builder'], FixedWidth=150, icon=QApplication.style().standardIcon(QStyle.SP_FileIcon))
+        self.explorer_node_add_btn = QPushButton(i18n['explorer_new_node'], FixedWidth=150, icon=_std_icon(QStyle.SP_FileDialogNewFolder))
+        self.explorer_node_create_btn = QPushButton(i18n['explorer_new_builder'], FixedWidth=150, icon=_std_icon(QStyle.SP_FileIcon))
         self.explorer_node_clone_btn = QPushButton(i18n['explorer_clone_node'], FixedWidth=150)  # ! there is srsly no icon for copy, cut or paste
         self.explorer_node_duplicate_btn = QPushButton(i18n['explorer_duplicate_node'], FixedWidth=150)  # ! there is srsly no icon for copy, cut or paste
         self.explorer_node_edit_root_btn = QPushButton(i18n['explorer_edit_root'], FixedWidth=150)
         self.explorer_node_import_btn = QPushButton(i18n['generic_import'], FixedWidth=150)
         self.explorer_node_export_btn = QPushButton(i18n['generic_export'], FixedWidth=150)
-        self.explorer_node_load_btn = QPushButton(i18n['generic_load'], FixedWidth=150, icon=QApplication.style().standardIcon(QStyle.SP_DialogOpenButton))
-        self.explorer_node_save_btn = QPushButton(i18n['generic_save'], FixedWidth=150, icon=QApplication.style().standardIcon(QStyle.SP_DialogSaveButton))
-        self.explorer_node_compile_btn = QPushButton(i18n['generic_compile'], FixedWidth=150, icon=QApplication.style().standardIcon(QStyle.SP_DialogApplyButton))
+        self.explorer_node_load_btn = QPushButton(i18n['generic_load'], FixedWidth=150, icon=open_icon)
+        self.explorer_node_save_btn = QPushButton(i18n['generic_save'], FixedWidth=150, icon=save_icon)
+        self.explorer_node_compile_btn = QPushButton(i18n['generic_compile'], FixedWidth=150, icon=_std_icon(QStyle.SP_DialogApplyButton))
         self.mthSpchtBuilderBtnStatus(0)
         hor_layour_22.addWidget(self.explorer_node_load_btn)
         hor_layour_22.addWidget(self.explorer_node_save_btn)
@@ -416,7 +503,7 @@ class SpchtMainWindow(object):
         exp_tab_form_if.addRow(i18n['node_if_field'], self.exp_tab_node_if_field)
         # line 2
         self.exp_tab_node_if_condition = QComboBox(placeholderText=i18n['node_if_comparator'])
-        self.exp_tab_node_if_condition.addItems(set([x for x in SpchtConstants.SPCHT_BOOL_OPS.values()]))
+        self.exp_tab_node_if_condition.addItems(SpchtConstants.SPCHT_BOOL_OPS_UNIQUE)
         self.exp_tab_node_if_condition.setCurrentIndex(0)
         exp_tab_form_if.addRow(i18n['node_if_condition'], self.exp_tab_node_if_condition)
         # line 3
@@ -486,38 +573,40 @@ class SpchtMainWindow(object):
         self.exp_tab_node_subdata_of = QComboBox(PlaceholderText=i18n['node_subdata_of_placeholder'])
         self.exp_tab_node_fallback = QComboBox(PlaceholderText=i18n['node_subfallback_placeholder'], ToolTip=i18n['tooltip_fallback'])
         self.exp_tab_node_orphan_node = QPushButton(i18n['explorer_orphan_node'],
-                                                    icon=QApplication.style().standardIcon(QStyle.SP_FileLinkIcon),
+                                                    icon=_std_icon(QStyle.SP_FileLinkIcon),
                                                     ToolTip=i18n['tooltip_orphan_node'])
         self.exp_tab_node_parent = QLabel()
-        exp_tab_form_inheritance.addRow(i18n['node_subdata'], self.exp_tab_node_subdata)
-        exp_tab_form_inheritance.addRow(i18n['node_subdata_of'], self.exp_tab_node_subdata_of)
-        exp_tab_form_inheritance.addRow(i18n['node_subnode'], self.exp_tab_node_subnode)
-        exp_tab_form_inheritance.addRow(i18n['node_subnode_of'], self.exp_tab_node_subnode_of)
-        exp_tab_form_inheritance.addRow(QLabel(""))
-        exp_tab_form_inheritance.addRow(i18n['node_fallback'], self.exp_tab_node_fallback)
-        exp_tab_form_inheritance.addRow(i18n['node_parent_info'], self.exp_tab_node_parent)
-        exp_tab_form_inheritance.addRow(QLabel(""))
-        exp_tab_form_inheritance.addRow(i18n['explorer_orphan_unite_label'], self.exp_tab_node_orphan_node)
+        add_row = exp_tab_form_inheritance.addRow  # one lookup for the whole block of rows
+        add_row(i18n['node_subdata'], self.exp_tab_node_subdata)
+        add_row(i18n['node_subdata_of'], self.exp_tab_node_subdata_of)
+        add_row(i18n['node_subnode'], self.exp_tab_node_subnode)
+        add_row(i18n['node_subnode_of'], self.exp_tab_node_subnode_of)
+        add_row(QLabel(""))
+        add_row(i18n['node_fallback'], self.exp_tab_node_fallback)
+        add_row(i18n['node_parent_info'], self.exp_tab_node_parent)
+        add_row(QLabel(""))
+        add_row(i18n['explorer_orphan_unite_label'], self.exp_tab_node_orphan_node)
 
         self.tab_node_insert_add_fields = QLineEdit()
         # * Michelangelo Tab (i just discovered i cannot write 'miscellaneous' without googling)
         self.exp_tab_misc = QWidget()
         exp_tab_form_various = QFormLayout(self.exp_tab_misc)
         # line 1
-        self.exp_tab_node_display_spcht = QPushButton(i18n['debug_spcht_json'], icon=QApplication.style().standardIcon(QStyle.SP_FileDialogContentsView))
+        self.exp_tab_node_display_spcht = QPushButton(i18n['debug_spcht_json'], icon=_std_icon(QStyle.SP_FileDialogContentsView))
         self.exp_tab_node_display_computed = QPushButton(i18n['debug_computed_json'])
-        self.exp_tab_node_save_node = QPushButton(i18n['generic_save_changes'], icon=QApplication.style().standardIcon(QStyle.SP_DialogSaveButton))
-        self.exp_tab_node_delete_node = QPushButton(i18n['explorer_delete_this_node'], icon=QApplication.style().standardIcon(QStyle.SP_DialogDiscardButton))
+        self.exp_tab_node_save_node = QPushButton(i18n['generic_save_changes'], icon=save_icon)
+        self.exp_tab_node_delete_node = QPushButton(i18n['explorer_delete_this_node'], icon=_std_icon(QStyle.SP_DialogDiscardButton))
         self.exp_tab_node_builder = QPushButton("Show complete SpchtBuilder")
-        exp_tab_form_various.addRow(i18n['explorer_node_save'], self.exp_tab_node_save_node)
-        exp_tab_form_various.addRow(QLabel(""))
-        exp_tab_form_various.addRow(i18n['explorer_node_delete'], self.exp_tab_node_delete_node)
-        exp_tab_form_various.addRow(QLabel(""))
-        exp_tab_form_various.addRow(QLabel(""))
-        exp_tab_form_various.addRow(QLabel(""))
-        exp_tab_form_various.addRow(i18n['debug_node_spcht'], self.exp_tab_node_display_spcht)
-        exp_tab_form_various.addRow(i18n['debug_node_computed'], self.exp_tab_node_display_computed)
-        exp_tab_form_various.addRow(i18n['debug_node_lock'], self.exp_tab_node_builder)
+        add_row = exp_tab_form_various.addRow
+        add_row(i18n['explorer_node_save'], self.exp_tab_node_save_node)
+        add_row(QLabel(""))
+        add_row(i18n['explorer_node_delete'], self.exp_tab_node_delete_node)
+        add_row(QLabel(""))
+        add_row(QLabel(""))
+        add_row(QLabel(""))
+        add_row(i18n['debug_node_spcht'], self.exp_tab_node_display_spcht)
+        add_row(i18n['debug_node_computed'], self.exp_tab_node_display_computed)
+        add_row(i18n['debug_node_lock'], self.exp_tab_node_builder)
 
         # bottom status line
         hor_layout_100 = QHBoxLayout()
@@ -582,34 +671,106 @@ class SpchtMainWindow(object):
         :return: nothing
         :rtype: None
         """
+        # resolve the setters once for all widgets instead of testing every known property per widget
+        setters = [(SpchtMainWindow._mass_setters[key], value if key in SpchtMainWindow._mass_sizes else (value,))
+                   for key, value in properties.items() if key in SpchtMainWindow._mass_setters]
         for each in widgets:
             if isinstance(each, (QPushButton, QLineEdit, QTableWidget, QTextEdit)):
-                if 'maximumHeight' in properties:
-                    each.setMaximumHeight(properties['maximumHeight'])
-                if 'maximumWidth' in properties:
-                    each.setMaximumWidth(properties['maximumWidth'])
-                if 'maximumSize' in properties:
-                    each.setMaximumSize(*properties['maximumSize'])
-                if 'minimumHeight' in properties:
-                    each.setMinimumHeight(properties['minimumHeight'])
-                if 'minimumWidth' in properties:
-                    each.setMinimumWidth(properties['minimumWidth'])
-                if 'minimumSize' in properties:
-                    each.setMinimumSize(*properties['minimumSize'])
-                if 'fixedHeight' in properties:
-                    each.setFixedHeight(properties['fixedHeight'])
-                if 'fixedWidth' in properties:
-                    each.setFixedWidth(properties['FixedWidth'])
-                if 'fixedSize' in properties:
-                    each.setFixedSize(*properties['fixedSize'])
-                if 'sizePolicy' in properties:
-                    each.setSizePolicy(properties['sizePolicy'])
-                if 'alignment' in properties:
-                    each.setAlignment(properties['alignment'])
-                if 'disabled' in properties:
-                    each.setDisabled(properties['disabled'])
-                if 'enabled' in properties:
-                    each.setEnabled(properties['enabled'])
+                for setter, arguments in setters:
+                    getattr(each, setter)(*arguments)
+
+
+class _JsonArbitraryEdit(QTextEdit):
+    """
+    Text edit for json data that starts hidden, palette & highlighter are only set up once it actually shows up
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._highlighter = None
+
+    def showEvent(self, event):
+        if self._highlighter is None:
+            bla = self.palette()  # copies palette with current design
+            bla.setColor(QPalette.Window, QColor.fromRgb(251, 241, 199))
+            bla.setColor(QPalette.WindowText, QColor.fromRgb(60, 131, 54))
+            self.setPalette(bla)  # and copies it back after some changes
+            self._highlighter = JsonHighlighter(self.document())
+        super().showEvent(event)
+
+
+class _ListModel(QtCore.QAbstractTableModel):
+    """
+    Plain table model for the ListDialogue, the cells live in a list of rows with one entry per column, None for an
+    empty cell, so filling the table costs no QTableWidgetItem per cell
+
+    Only the first `chunk` rows are shown at first, the view asks for more via fetchMore once it scrolls to the end
+    """
+    chunk = 200
+
+    def __init__(self, rows: list, columns: int, headers=None, parent=None):
+        super().__init__(parent)
+        self._rows = rows
+        self._columns = columns
+        self._headers = list(headers) if headers else []
+        self._exposed = min(len(rows), self.chunk)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._exposed
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        return not parent.isValid() and self._exposed < len(self._rows)
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        more = min(len(self._rows) - self._exposed, self.chunk)
+        if parent.isValid() or more <= 0:
+            return
+        self.beginInsertRows(parent, self._exposed, self._exposed + more - 1)
+        self._exposed += more
+        self.endInsertRows()
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._columns
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if index.isValid() and role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if not index.isValid() or role != QtCore.Qt.EditRole:
+            return False
+        self._rows[index.row()][index.column()] = value
+        self.dataChanged.emit(index, index)
+        return True
+
+    def flags(self, index):
+        return QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal and section < len(self._headers):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def insertRows(self, row, count, parent=QtCore.QModelIndex()):
+        new_rows = [[None] * self._columns for _ in range(count)]
+        if row > self._exposed:  # behind what the view knows of, it will be fetched with the rest
+            self._rows[row:row] = new_rows
+            return True
+        self.beginInsertRows(parent, row, row + count - 1)
+        self._rows[row:row] = new_rows
+        self._exposed += count
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QtCore.QModelIndex()):
+        count = min(count, self._exposed - row)  # the view can only select what it was shown
+        if count <= 0:
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._rows[row:row + count]
+        self._exposed -= count
+        self.endRemoveRows()
+        return True
 
 
 class ListDialogue(QDialog):
@@ -626,7 +787,7 @@ class ListDialogue(QDialog):
 
         self.layout = QVBoxLayout()
         top_mesage = QLabel(main_message)
-        self.table = QTableWidget()
+        self.table = QTableView()
         self.addBtn = QPushButton(i18n['insert_before'], icon=QIcon.fromTheme('insert-image'))
         self.deleteBtn = QPushButton(i18n['generic_delete'], icon=QIcon.fromTheme('delete'))
         btn_line = QHBoxLayout()
@@ -639,47 +800,40 @@ class ListDialogue(QDialog):
         self.setLayout(self.layout)
 
         # * setup table
-        self.tablemodel = QStandardItemModel()
-
         if not headers:
             if init_data and isinstance(init_data, dict):
-                dict_len = 2
+                columns = 2
                 for value in init_data.values():
                     if isinstance(value, list):
-                        if temp := len(value) > dict_len:
-                            dict_len = temp
-                self.table.setColumnCount(dict_len)
+                        columns = max(columns, len(value) + 1)  # key plus one column per value
             else:
-                self.table.setColumnCount(1)
-                self.table.setHorizontalHeaderLabels([i18n['value']])
+                columns = 1
+                headers = [i18n['value']]
         else:
-            self.table.setColumnCount(len(headers))
-            self.table.setHorizontalHeaderLabels(headers)
+            columns = len(headers)
 
+        rows = []
         if init_data:
             if isinstance(init_data, list):
-                self.table.setRowCount(len(init_data)+1)
-                for i, each in enumerate(init_data):
-                    self.table.setItem(i, 0, QTableWidgetItem(each))
+                rows = [[each] + [None] * (columns - 1) for each in init_data]
             if isinstance(init_data, dict):
-                self.table.setRowCount(len(init_data.keys()) + 1)
-                for i, (key, value) in enumerate(init_data.items()):
-                    self.table.setItem(i, 0, QTableWidgetItem(str(key)))
-                    if isinstance(value, list):
-                        for j, each in enumerate(value):
-                            self.table.setItem(i, j+1, QTableWidgetItem(str(each)))
-                    else:
-                        self.table.setItem(i, 1, QTableWidgetItem(str(value)))
-                self.table.resizeColumnToContents(0)
-        else:
-            self.table.setRowCount(1)
+                for key, value in init_data.items():
+                    row = [str(key)] + [None] * (columns - 1)
+                    values = [str(each) for each in value] if isinstance(value, list) else [str(value)]
+                    row[1:len(values) + 1] = values
+                    rows.append(row[:columns])
+        rows.append([None] * columns)  # always one empty line to write into
+        self.tablemodel = _ListModel(rows, columns, headers)
+        self.table.setModel(self.tablemodel)
+        if isinstance(init_data, dict) and init_data:
+            self.table.resizeColumnToContents(0)
 
         self.table.horizontalHeader().setStretchLastSection(True)
 
         # ! final event setup:
         self.deleteBtn.clicked.connect(self.deleteCurrentRow)
         self.addBtn.clicked.connect(self.insertCurrentRow)
-        self.table.itemChanged.connect(self.dataChange)
+        self.tablemodel.dataChanged.connect(self.dataChange)
         self.buttonBox.accepted.connect(self.accept)
         self.buttonBox.rejected.connect(self.reject)
 
@@ -690,7 +844,7 @@ class ListDialogue(QDialog):
             rows.add(index.row())
 
         for row in sorted(rows, reverse=True):
-            self.table.removeRow(row)
+            self.tablemodel.removeRow(row)
 
     def insertCurrentRow(self):
         rows = set()
@@ -699,62 +853,52 @@ class ListDialogue(QDialog):
         lastRow = 0  # i have the feeling that this is not the most optimal way
         for row in sorted(rows):
             lastRow = row
-        self.table.insertRow(lastRow)
+        self.tablemodel.insertRow(lastRow)
 
     def dataChange(self):
-        # adds empty lines if none are present after editing
-        model = self.table.model()
-        is_empty = False
-        for row in range(self.table.rowCount()):
-            row_filled = False
-            for column in range(self.table.columnCount()):
-                cell_data = self.table.item(row, column)
-                if cell_data and str(cell_data.text()).strip() != "":
-                    row_filled = True
-                    break
-            if not row_filled:  # at least one empty line
-                is_empty = True
-                break
-
-        if not is_empty:
-            self.table.setRowCount(self.table.rowCount()+1)
+        # adds an empty line at the end once the last one got filled
+        rows = self.tablemodel._rows
+        if not rows or any(cell is not None and str(cell).strip() != "" for cell in rows[-1]):
+            self.tablemodel.insertRow(len(rows))
 
     def getList(self):
-        model = self.table.model()
-        data = []
-        for row in range(model.rowCount()):
-            cell_data = model.data(model.index(row, 0))
-            if cell_data:  # for some reasons Python 3.8 cannot combine those with an and, weird
-                if (content := str(cell_data).strip()) != "":
-                    data.append(content)
-        return data
+        # the model keeps plain python lists, no need to go through data() and an index for every cell
+        return [content for row in self.tablemodel._rows
+                if row[0] is not None and (content := str(row[0]).strip()) != ""]
 
     def getDictionary(self):
-        temp_model = self.table.model()
         data = {}
-        for row in range(temp_model.rowCount()):
-            key = temp_model.data(temp_model.index(row, 0))
+        for key, *values in self.tablemodel._rows:
             if key:
-                values = []
-                for column in range(1, temp_model.columnCount()):
-                    values.append(temp_model.data(temp_model.index(row, column)))
                 if len(values) == 1:
                     values = values[0]
                 data[key] = values
         return data
 
     def getData(self):
-        if self.table.columnCount() == 1:
+        if self.tablemodel.columnCount() == 1:
             return self.getList()
         else:
             return self.getDictionary()
 
 
+class _ReadOnlyItem(QStandardItem):
+    """
+    A list entry that can be selected and dragged around but not edited, saves every caller the second call
+    """
+    def __init__(self, text: str):
+        super().__init__(text)
+        # * i really dislike this, but i found no one liner solution in 5 minutes so i had to give up, sad
+        # ? item.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable)
+        # ? setEditable wraps just setFlag while preserving the others
+        self.setEditable(False)
+
+
 class SelectionDialogue(QDialog):
     """
     Accepts two lists, presumes ever element on each list is an overall unique string (but case sensitive, so that
-    'name' and 'Name' are different things) Gives the user the ability to swap elements of the list. The underlaying
-    technique to move elemnts is primitiv, doesnt scale well and is a source of eternal shame. But it works well enough
+    'name' and 'Name' are different things) Gives the user the ability to swap elements of the list. Both lists are
+    kept sorted case insensitive, a moved element gets put into its spot in the other list directly
     """
     def __init__(self, title: str, list_a: list, list_b: list, parent=None):
         super().__init__(parent)
@@ -773,8 +917,8 @@ class SelectionDialogue(QDialog):
         self.model_2 = QStandardItemModel()
         self.list_2.setModel(self.model_2)
         layout_middle = QVBoxLayout()
-        self.btn_left = QPushButton(icon=QApplication.style().standardIcon(QStyle.SP_ArrowLeft))
-        self.btn_right = QPushButton(icon=QApplication.style().standardIcon(QStyle.SP_ArrowRight))
+        self.btn_left = QPushButton(icon=_std_icon(QStyle.SP_ArrowLeft))
+        self.btn_right = QPushButton(icon=_std_icon(QStyle.SP_ArrowRight))
         # Cross Platform arrows arent exactly straight forward, some humans suggested this:
         # icon=QIcon.fromTheme("arrow-left")
         # but it seems to not work under windows, both do in Linux with KDE
@@ -801,61 +945,47 @@ class SelectionDialogue(QDialog):
 
     def mthSortData(self, list_a, list_b):
         list_1 = set(list_a)  # unique element list of list_a
-        for element in sorted(list_a, key=str.lower):
-            element_of_nothing = QStandardItem(element)
-            element_of_nothing.setEditable(False)
-            # * i really dislike this, but i found no one liner solution in 5 minutes so i had to give up, sad
-            # ? item.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable)
-            # ? setEditable wraps just setFlag while preserving the others
-            self.model_1.appendRow(element_of_nothing)
-        for element in sorted(list_b, key=str.lower):
-            if element not in list_1:  # uniqueness check
-                element_of_nothing = QStandardItem(element)
-                element_of_nothing.setEditable(False)
-                self.model_2.appendRow(element_of_nothing)
-
-    def LeftToRightMove(self):
-        index = self.list_1.currentIndex()
-        if index.row() < 0:
-            return
-        item = self.model_1.itemFromIndex(index)
-        # iterating through all elements of the list, sorting and adding because this is quicker for me
-        list_2_items = []
-        for _ in range(self.model_2.rowCount()):
-            item2 = self.model_2.item(_)
-            list_2_items.append(item2.text())
-        list_2_items.append(item.text())
-        # * now we remove the activated item
-        self.model_1.removeRow(index.row())
-        # * clearing the model and re-adding everything with their now sister among them
-        self.model_2.clear()
-        for element in sorted(list_2_items, key=str.lower):
-            element_of_nothing = QStandardItem(element)
-            element_of_nothing.setEditable(False)
-            self.model_2.appendRow(element_of_nothing)
-
-    def RightToLeftMove(self):
+        # * every element is lowered exactly once, the (key, element) pairs sort and fill the key lists alike
+        sorted_1 = sorted((element.lower(), element) for element in list_1)
+        sorted_2 = sorted((element.lower(), element) for element in set(list_b) if element not in list_1)
+        # lower case twins of both models, same order, for the binary search in _move
+        self._keys_1 = [key for key, _ in sorted_1]
+        self._keys_2 = [key for key, _ in sorted_2]
+        for model, sorted_elements in ((self.model_1, sorted_1), (self.model_2, sorted_2)):
+            # * all rows in one insertion, the view lays out once instead of once per element
+            model.invisibleRootItem().appendRows([_ReadOnlyItem(element) for _, element in sorted_elements])
+
+    def _move(self, source_view: QListView, source_model: QStandardItemModel, source_keys: list,
+              target_model: QStandardItemModel, target_keys: list):
         """
-        Carbon Copy of LeftToRight
+        Moves the current item of one list to its sorted place in the other, both lists stay sorted by lower case
+        text so the spot can be found by binary search instead of sorting everything again
+
+        :param source_view: list view the user selected something in
+        :param source_model: model of that view
+        :param source_keys: lower case texts of source_model, same order
+        :param target_model: model of the other list
+        :param target_keys: lower case texts of target_model, same order
+        :return: nothing
+        :rtype: None
         """
-        index = self.list_2.currentIndex()
+        index = source_view.currentIndex()
         if index.row() < 0:
             return
-        item = self.model_2.itemFromIndex(index)
-        # iterating through all elements of the list, sorting and adding because this is quicker for me
-        list_1_items = []
-        for _ in range(self.model_1.rowCount()):
-            item1 = self.model_1.item(_)
-            list_1_items.append(item1.text())
-        list_1_items.append(item.text())
+        text = source_model.itemFromIndex(index).text()
         # * now we remove the activated item
-        self.model_2.removeRow(index.row())
-        # * clearing the model and re-adding everything with their now sister among them
-        self.model_1.clear()
-        for element in sorted(list_1_items, key=str.lower):
-            element_of_nothing = QStandardItem(element)
-            element_of_nothing.setEditable(False)
-            self.model_1.appendRow(element_of_nothing)
+        source_model.removeRow(index.row())
+        del source_keys[index.row()]
+        key = text.lower()
+        position = bisect.bisect_right(target_keys, key)  # behind equal ones, like the stable sort did
+        target_keys.insert(position, key)
+        target_model.insertRow(position, _ReadOnlyItem(text))
+
+    def LeftToRightMove(self):
+        self._move(self.list_1, self.model_1, self._keys_1, self.model_2, self._keys_2)
+
+    def RightToLeftMove(self):
+        self._move(self.list_2, self.model_2, self._keys_2, self.model_1, self._keys_1)
 
     def getListA(self):
         items = []
@@ -873,6 +1003,9 @@ class SelectionDialogue(QDialog):
 
 
 class SolrDialogue(QDialog):
+    # solr parameter names in the order getData lists its line edits
+    _parameter_keys = ("url", "q", "sort", "start", "rows", "fq", "fl")
+
     def __init__(self, title: str, defaults: dict, message=None, parent=None):
         super().__init__(parent)
 
@@ -897,16 +1030,17 @@ class SolrDialogue(QDialog):
         self.req_filter = QLineEdit(PlaceholderText=i18n['dlg_solr_q_filter'])
         self.req_fields = QLineEdit(PlaceholderText=i18n['dlg_solr_q_fl'])
 
-        self.layout.addRow(self.message)
-        self.layout.addRow(i18n['dlg_solr_url'], self.req_url)
-        self.layout.addRow(QLabel(""))
-        self.layout.addRow(i18n['dlg_solr_q'], self.req_q)
-        self.layout.addRow(i18n['dlg_solr_sort'], self.req_sort)
-        self.layout.addRow(i18n['dlg_solr_start'], self.req_start)
-        self.layout.addRow(i18n['dlg_solr_rows'], self.req_rows)
-        self.layout.addRow(i18n['dlg_solr_filter'], self.req_filter)
-        self.layout.addRow(i18n['dlg_solr_fields'], self.req_fields)
-        self.layout.addRow(self.button_box)
+        add_row = self.layout.addRow
+        add_row(self.message)
+        add_row(i18n['dlg_solr_url'], self.req_url)
+        add_row(QLabel(""))
+        add_row(i18n['dlg_solr_q'], self.req_q)
+        add_row(i18n['dlg_solr_sort'], self.req_sort)
+        add_row(i18n['dlg_solr_start'], self.req_start)
+        add_row(i18n['dlg_solr_rows'], self.req_rows)
+        add_row(i18n['dlg_solr_filter'], self.req_filter)
+        add_row(i18n['dlg_solr_fields'], self.req_fields)
+        add_row(self.button_box)
 
         self.setLayout(self.layout)
 
@@ -925,24 +1059,12 @@ class SolrDialogue(QDialog):
         self.req_fields.setText(defaults.get('fl', ""))
 
     def getData(self):
-        elements = {
-            "url": self.req_url,
-            "q": self.req_q,
-            "sort": self.req_sort,
-            "start": self.req_start,
-            "rows": self.req_rows,
-            "fq": self.req_filter,
-            "fl": self.req_fields
-        }
-        parameters = {}
-        for widget in elements:
-            if elements[widget].text().strip() != "":
-                parameters[widget] = elements[widget].text().strip()
-        return parameters
+        widgets = (self.req_url, self.req_q, self.req_sort, self.req_start, self.req_rows, self.req_filter, self.req_fields)
+        return {key: text for key, widget in zip(self._parameter_keys, widgets) if (text := widget.text().strip())}
 
 
 class RootNodeDialogue(QDialog):
-    def __init__(self, root_node: SimpleSpchtNode, childs=None, parent=None):
+    def __init__(self, root_node: 'SimpleSpchtNode', childs=None, parent=None):
         super().__init__(parent)
         self.setWindowTitle(i18n['root_dia_title'])
         self.setMinimumWidth(300)
@@ -956,10 +1078,14 @@ class RootNodeDialogue(QDialog):
         self.in_source = QComboBox()
         self.in_source.addItems(SpchtConstants.SOURCES)
         self.in_fallback = QComboBox()
-        self.in_fallback.addItem("")
         if childs:
-            self.in_fallback.addItems(childs)
+            # * one model for all names instead of an item each, parented so it lives as long as the box
+            self.in_fallback.setModel(QtCore.QStringListModel([""] + list(childs), self.in_fallback))
+            fallback_view = QListView()  # the default view is only known as abstract item view to the bindings
+            fallback_view.setUniformItemSizes(True)  # rows are single lines of text, no need to measure each
+            self.in_fallback.setView(fallback_view)
         else:
+            self.in_fallback.addItem("")
             self.in_fallback.setDisabled(True)
         self.in_prefix = QLineEdit("")
         if 'prepend' in root_node and root_node['prepend'].strip != "":
@@ -1000,6 +1126,7 @@ class RootNodeDialogue(QDialog):
         self.buttonBox.rejected.connect(self.reject)
 
     def get_node_from_dialogue(self):
+        from Spcht.Gui.SpchtBuilder import SimpleSpchtNode  # only needed here, spares the module the whole builder
         root = SimpleSpchtNode(":ROOT:", ":ROOT:")
         root['field'] = self.in_field.text()
         root['source'] = self.in_source.currentText()
@@ -1041,7 +1168,7 @@ class JsonDialogue(QDialog):
         if isinstance(data, str):
             self.editor.setPlainText(data)
         elif isinstance(data, (list, dict)):
-            self.editor.setPlainText(json.dumps(data, indent=3))
+            self.editor.setPlainText(pretty_json(data))
 
         self.buttonBox.accepted.connect(self.accept)
         self.buttonBox.rejected.connect(self.reject)
@@ -1058,13 +1185,17 @@ class FernmeldeAmt(QtCore.QObject):
 
 
 class MoveUpDownWidget(QWidget):
+    UP_TEXT = "↑"
+    DOWN_TEXT = "↓"
+
     def __init__(self, label, parent=None):
         super(MoveUpDownWidget, self).__init__()
         self.c = FernmeldeAmt()
         self.check = QCheckBox(label)
-        self.up = QPushButton("↑")
-        self.down = QPushButton("↓")
-        SpchtMainWindow.massSetProperty(self.up, self.down, maximumWidth=30, maximumHeight=20)
+        self.up = QPushButton(MoveUpDownWidget.UP_TEXT)
+        self.down = QPushButton(MoveUpDownWidget.DOWN_TEXT)
+        for button in (self.up, self.down):  # one of these per row, no need for the generic massSetProperty
+            button.setMaximumSize(30, 20)
 
         layout = QHBoxLayout()
         layout.setSpacing(5)
@@ -1085,17 +1216,20 @@ class MoveUpDownWidget(QWidget):
 
 
 class JsonHighlighter(QSyntaxHighlighter):
-    braces = ['\{', '\}', '\(', '\)', '\[', '\]']
-    bools = ["TRUE", "FALSE", "True", "False", "true", "false"]
-    colons = ["\:", "\,"]
+    bools = frozenset(("TRUE", "FALSE", "True", "False", "true", "false"))
+    # one alternative per token kind, the group name is the key of qSTYLES, an unterminated quote matches nothing
+    # ! QRegularExpression counts in utf-16 units just like setFormat does, python indices would drift after an emoji
+    tokens = QtCore.QRegularExpression(r'(?P<string>"(?:[^"\\]|\\.)*")|(?P<number>\d+)|(?P<braces>[{}()\[\]])'
+                                       r'|(?P<colons>[:,])|(?P<word>[^\W\d_]\w*)',
+                                       QtCore.QRegularExpression.UseUnicodePropertiesOption)
+    token_kinds = ('string', 'number', 'braces', 'colons', 'word')
 
     def __init__(self, parent: QTextDocument, lexer=None):
         super(JsonHighlighter, self).__init__(parent)
         self.colors = {}
         self.colorSchema()
-        self.highlightingRules = []
 
-        qSTYLES = {
+        self.qSTYLES = {
             'bools': self.qformat(214, 93, 14, style='bold'),
             'braces': self.qformat(124, 111, 100),
             'string': self.qformat(152, 151, 26),
@@ -1103,23 +1237,30 @@ class JsonHighlighter(QSyntaxHighlighter):
             'colons': self.qformat(69, 133, 136, style="bold")
         }
 
-        rules = []
-        rules += [(f'{x}', 0, qSTYLES['braces']) for x in JsonHighlighter.braces]
-        rules += [(f'{x}', 0, qSTYLES['bools']) for x in JsonHighlighter.bools]
-        rules += [(f'{x}', 0, qSTYLES['colons']) for x in JsonHighlighter.colons]
-        rules.append(('[0-9]+', 0, qSTYLES['number']))
-        rules.append(('"([^"]*)"', 0, qSTYLES['string']))
-        self.rules = [(QtCore.QRegExp(pat), index, fmt) for (pat, index, fmt) in rules]
-        # this only really works because the last rule overwrites all the wrongly matched things from before
+    def _tokenize(self, text: str):
+        """
+        Walks a line of json once from left to right and yields every region that gets a colour, all token kinds
+        share one compiled pattern so every character is looked at by a single state machine, strings are consumed
+        as a whole so nothing inside them is ever looked at twice
+
+        :param str text: one block of the document
+        :return: generator of (start, length, format), positions in utf-16 units as setFormat expects them
+        :rtype: tuple
+        """
+        matches = JsonHighlighter.tokens.globalMatch(text)
+        while matches.hasNext():
+            match = matches.next()
+            group = next(name for name in JsonHighlighter.token_kinds if match.capturedStart(name) != -1)
+            kind = group
+            if group == 'word':  # words are only consumed so no number inside them gets coloured
+                if match.captured(group) not in JsonHighlighter.bools:
+                    continue
+                kind = 'bools'
+            yield match.capturedStart(group), match.capturedLength(group), self.qSTYLES[kind]
 
     def highlightBlock(self, text):
-        for expressions, nth, forma in self.rules:
-            index = expressions.indexIn(text, 0)
-            while index >= 0:
-                index = expressions.pos(nth)
-                length = len(expressions.cap(nth))
-                self.setFormat(index, length, forma)
-                index = expressions.indexIn(text, index + length)
+        for start, length, forma in self._tokenize(text):
+            self.setFormat(start, length, forma)
         self.setCurrentBlockState(0)
         # self.setFormat(0, 25, self.rules[0][2])
 
@@ -1180,6 +1321,34 @@ class Formatter(logging.Formatter):
         return s
 
 
+def lay2widget(layout: QLayout) -> QWidget:
+    """
+    Wraps a layout in a plain widget for all the places that only take widgets, like stacks or toolboxes
+
+    :param layout: any filled layout
+    :return: a new widget with the layout set
+    :rtype: QWidget
+    """
+    wrapper = QWidget()
+    wrapper.setLayout(layout)
+    return wrapper
+
+
+@lru_cache(maxsize=8)
+def _find_fixed_font(size: int) -> QFont:
+    _fixed_font_candidates = [("Iosevka", "Light"), ("Fira Code", "Regular"), ("Hack", "Regular")]
+    font_database = QFontDatabase()  # one database for all probes
+    std_font = font_database.font("fsdopihfgsjodfgjhsadfkjsdf", "Doomsday", size)
+    # * i am once again questioning my logic here but this seems to work
+    for font, style in _fixed_font_candidates:
+        a_font = font_database.font(font, style, size)
+        if a_font != std_font:
+            return a_font
+    backup = QFontDatabase.systemFont(QFontDatabase.FixedFont)
+    backup.setPointSize(size)
+    return backup
+
+
 def tryForFont(size: int):
     """
     tries to load one of the specified fonts in the set size
@@ -1187,19 +1356,12 @@ def tryForFont(size: int):
     the fonts hardcoded here are the creators preference, if you ever see this and do not know them, take a look
     you might like them
 
+    the font database is only asked once per size, every caller gets its own copy of the result to change at will
+
     :param size: point size of the font in px
     :type size: int
     :return: hopefully one of the QFonts, else a fixed font one
     :rtype: QFont
     """
-    _fixed_font_candidates = [("Iosevka", "Light"), ("Fira Code", "Regular"), ("Hack", "Regular")]
-    std_font = QFontDatabase().font("fsdopihfgsjodfgjhsadfkjsdf", "Doomsday", size)
-    # * i am once again questioning my logic here but this seems to work
-    for font, style in _fixed_font_candidates:
-        a_font = QFontDatabase().font(font, style, size)
-        if a_font != std_font:
-            return a_font
-    backup = QFontDatabase.systemFont(QFontDatabase.FixedFont)
-    backup.setPointSize(size)
-    return backup
+    return QFont(_find_fixed_font(size))
 
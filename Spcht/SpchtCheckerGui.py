@@ -29,12 +29,13 @@ import sys
 import copy
 import codecs
 import time
+from functools import lru_cache
 from dateutil.relativedelta import relativedelta
 from datetime import datetime
 from pathlib import Path
 
 import appdirs
-from PySide2.QtGui import QStandardItemModel, QStandardItem, QIcon, QScreen
+from PySide2.QtGui import QStandardItemModel, QStandardItem, QIcon, QScreen, QTextCursor
 from PySide2.QtWidgets import *
 from PySide2 import QtWidgets, QtCore
 
@@ -46,8 +47,9 @@ from Spcht.Gui.SpchtBuilder import SpchtBuilder, SimpleSpchtNode, RESERVED_NAMES
 from Spcht.Core.SpchtCore import Spcht
 
 import Spcht.Core.SpchtUtility as SpchtUtility
+from Spcht.Gui.SpchtCheckerGui_i18n import load_json_mapped
 from Spcht.Gui.SpchtCheckerGui_interface import SpchtMainWindow, ListDialogue, JsonDialogue, SelectionDialogue, \
-    QLogHandler, SolrDialogue, RootNodeDialogue, resource_path, i18n, __appauthor__, __appname__
+    QLogHandler, SolrDialogue, RootNodeDialogue, resource_path, pretty_json, i18n, __appauthor__, __appname__
 
 __SOLR_MAX_START__ = 25000
 __SOLR_MAX_ROWS__ = 500
@@ -67,17 +69,61 @@ except ImportError:
     pass
 
 
+_CONTAINERS = (list, dict)
+_TREE_ADDITIONALS = ("append", "prepend", "cut", "replace", "match", "joined_field")  # shown in the info column
+# * kinds of keys in the explorer, each of these only matches if the cheap 'in' test before it is true
+_MARC_KEY = re.compile(r"^[0-9]{1,3}:\w+$")  # 245:a
+_TREE_KEY = re.compile(r"^(?:\w*>)+\w+$")  # contains at least one 'word' + '>', otherwise it might be dict
+_SEARCH_KEY = re.compile(r"^\w*:\w+$")  # key:value
+
+
+@lru_cache(maxsize=None)
+def curated_node_headers() -> tuple:
+    """
+    Key and translated header of every column in the SpchtView, the language does not change at runtime so they
+    are only looked up once and every window shares them
+    :return: a dictionary with 'key' and 'header' for each curated key
+    :rtype: tuple
+    """
+    # * condensly generates the names for SpchtView Headers
+    return tuple({'key': x, 'header': i18n[f'col_{x}']} for x in SpchtBuilder.default_curated_keys)
+
+
+@lru_cache(maxsize=128)
+def marc_field_keys(full_record: str) -> frozenset:
+    """
+    All 'field:subfield' keys of a marc21 record, once as is and once with a zero padded field, the record string
+    itself is the key of the cache so a reloaded data set does not decode the same records again
+
+    :param str full_record: the binary marc record as found in a solr dump
+    :return: both spellings of every key
+    :rtype: frozenset
+    """
+    keys = set()
+    for main_key, top_value in SpchtUtility.marc2list(full_record).items():
+        if isinstance(top_value, list):
+            sub_keys = {sub_key for param_list in top_value for sub_key in param_list}
+        elif isinstance(top_value, dict):
+            sub_keys = top_value.keys()
+        else:
+            continue
+        # i think this is faster than if-ing my way through, both spellings of the field are formatted only once
+        plain, padded = f"{main_key}:", f"{main_key:03d}:"
+        keys.update(plain + sub_key for sub_key in sub_keys)
+        keys.update(padded + sub_key for sub_key in sub_keys)
+    return frozenset(keys)
+
+
 def delta_time_human(**kwargs):
     # https://stackoverflow.com/a/11157649
     attrs = ['years', 'months', 'days', 'hours', 'minutes', 'seconds', 'microseconds']
     delta = relativedelta(**kwargs)
-    human_string = ""
+    parts = []
     for attr in attrs:
-        if getattr(delta, attr):
-            if human_string != "":
-                human_string += ", "
-            human_string += '%d %s' % (getattr(delta, attr), getattr(delta, attr) > 1 and attr or attr[:-1])
-    return human_string
+        value = getattr(delta, attr)
+        if value:
+            parts.append('%d %s' % (value, attr if value > 1 else attr[:-1]))
+    return ", ".join(parts)
 
 
 def disableEdits(*args1: QStandardItem):
@@ -86,87 +132,94 @@ def disableEdits(*args1: QStandardItem):
         each.setEditable(False)
 
 
+_time_stamps = {}  # time_string -> (second, formatted stamp), log lines come in bursts within the same second
+
+
 def time_log(line: str, time_string="%Y.%m.%d-%H:%M:%S", spacer="\n", end="\n"):
-    return f"{datetime.now().strftime(time_string)}{spacer}{line}{end}"
+    now = time.time()
+    second = int(now)
+    cached = _time_stamps.get(time_string)
+    if cached is None or cached[0] != second or "%f" in time_string:  # microseconds cannot be reused
+        cached = _time_stamps[time_string] = (second, datetime.fromtimestamp(now).strftime(time_string))
+    return f"{cached[1]}{spacer}{line}{end}"
 
 
 def confirm_flatness(data: dict or list) -> bool:
     """
     Takes some data, presumed dictionary or list and checks if its all flat or nested
+
+    flat means a record holds only plain values or lists of plain values, a list of data may contain such records
     :param dict or list data:
     :return: True or False if not so flat
     :rtype: bool
     """
     if isinstance(data, dict):
-        for item in data.values():
-            if isinstance(item, dict):
-                return False
-            if isinstance(item, list):
-                for each in item:
-                    if isinstance(each, (list, dict)):
-                        return False
+        records = (data, )
     elif isinstance(data, list):
-        for entry in data:
-            if isinstance(entry, list):
+        records = data
+    else:
+        return True
+    for record in records:
+        if not isinstance(record, dict):
+            if isinstance(record, list):
                 return False
-            if isinstance(entry, dict):
-                for item in entry.values():
-                    if isinstance(item, dict):
+            continue
+        for item in record.values():
+            if isinstance(item, _CONTAINERS):  # one check for the usual plain value
+                if isinstance(item, dict):
+                    return False
+                for each in item:
+                    if isinstance(each, _CONTAINERS):
                         return False
-                    if isinstance(item, list):
-                        for each in item:
-                            if isinstance(each, (list, dict)):
-                                return False
     return True
 
 
 def data_object_keys(data):
+    """
+    Lists the path to every value of some arbitrary json data, keys are joined by '>', a list is noted as '[]'.
+    A list that holds nothing but plain values still shows up with its own path. Walks the data with its own
+    stack instead of recursion, deep records cost no python frames and no path gets rebuilt on every level
+
+    :param dict or list data: anything loaded from json
+    :return: all found paths
+    :rtype: set
+    """
     all_fields = set()
     if isinstance(data, dict):
-        for field in recurse_dictionary(data):
-            all_fields.add(field)
-    if isinstance(data, list):
-        variants = recurse_list(data)
-        if variants:
-            for each in variants:
-                all_fields.add(f"[]>{each}")
-        # no else, if there are only values of values the set is empty as their is nothing to talk to
-    return all_fields
-
-
-def recurse_dictionary(dictionary: dict):
-    result_set = set()
-    for key, element in dictionary.items():
-        if isinstance(element, dict):
-            for each in recurse_dictionary(dictionary[key]):
-                result_set.add(f"{key}>{each}")
-        elif isinstance(element, list):
-            variants = recurse_list(dictionary[key])
-            if variants:
-                for each in variants:
-                    result_set.add(f"{key}>{each}")
-            else:
-                result_set.add(key)
+        stack = [(data, None, None)]
+    elif isinstance(data, list):
+        stack = [(data, "[]", None)]  # no fallback, if there are only values of values there is nothing to talk to
+    else:
+        return all_fields
+    found = 0  # counts every path, the set alone would not tell if a list below added a repeated one
+    while stack:
+        node, path, fallback = stack.pop()
+        if node is None:  # every child of a list is done, path is what it falls back to, fallback the count before
+            if found == fallback:
+                all_fields.add(path)
+                found += 1
+        elif isinstance(node, dict):
+            leaves = []  # plain values of this level, handed to the set in one go
+            for key, element in node.items():
+                key_path = key if path is None else f"{path}>{key}"
+                if isinstance(element, dict):
+                    stack.append((element, key_path, None))
+                elif isinstance(element, list):
+                    stack.append((element, key_path, key_path))
+                else:
+                    leaves.append(key_path)
+            all_fields.update(leaves)
+            found += len(leaves)
         else:
-            result_set.add(key)
-    return result_set
-
-
-def recurse_list(multivalue: list):
-    # returns an empty set if only actual values were found
-    result_set = set()
-    for element in multivalue:
-        if isinstance(element, dict):
-            for each in recurse_dictionary(element):
-                result_set.add(f"[]>{each}")
-        elif isinstance(element, list):
-            variants = recurse_list(element)
-            if variants:
-                for each in variants:
-                    result_set.add(f"[]>{each}")
-            else:
-                result_set.add(f"[]>[]")
-    return result_set
+            if fallback is not None:  # gets looked at after every child of this list
+                stack.append((None, fallback, found))
+            element_path = f"{path}>[]"
+            for element in node:
+                if isinstance(element, dict):
+                    stack.append((element, element_path, None))
+                elif isinstance(element, list):
+                    stack.append((element, element_path, f"{element_path}>[]"))
+    return all_fields
 
 
 def handle_variants(dictlist: dict or list) -> list:
@@ -192,6 +245,74 @@ def handle_variants(dictlist: dict or list) -> list:
     # return dictlist  # this will most likely throw an exception, we kinda want that
 
 
+class _SpchtLoadSignals(QtCore.QObject):
+    # (job, path, spcht data, schema status, schema output, error, followups)
+    loaded = QtCore.Signal(object)
+
+
+class SpchtLoadJob(QtCore.QRunnable):
+    """
+    Reads and validates a spcht descriptor file in a thread of the pool so the window does not freeze on big files,
+    the result travels back to the gui thread with the loaded signal, everything else happens there
+    """
+    def __init__(self, path_to_file: str, followup=None):
+        super().__init__()
+        self.path = path_to_file
+        self.followups = [followup] if followup else []  # called in the gui thread once the result is handled
+        self.signals = _SpchtLoadSignals()  # created here, so it lives in the gui thread
+
+    def run(self):
+        spcht_data, status, output, error = None, False, None, None
+        try:
+            spcht_data = load_json_mapped(self.path)  # uses orjson if available
+            status, output = SpchtUtility.schema_validation(spcht_data)
+        except Exception as e:  # anything that escapes here would end the thread silently, the gui has to hear of it
+            error = e
+        self.signals.loaded.emit((self, self.path, spcht_data, status, output, error, self.followups))
+
+
+class _TestdataSignals(QtCore.QObject):
+    progress = QtCore.Signal(int)  # number of processed entries
+    # (job, triples, sparql texts, error)
+    processed = QtCore.Signal(object)
+
+
+class TestdataJob(QtCore.QRunnable):
+    """
+    Runs every entry of the test data through the loaded Spcht in a thread of the pool, progress and the resulting
+    triples travel back to the gui thread with signals, the widgets are only ever touched there
+    """
+    progress_steps = 100  # the bar does not need to hear about every single entry
+
+    def __init__(self, spcht: Spcht, test_set: list, subject: str, descriptions: dict):
+        super().__init__()
+        self.spcht = spcht
+        self.test_set = test_set
+        self.subject = subject
+        self.descriptions = descriptions  # optional names for the ids, from the .descri file
+        self.started = datetime.now()
+        self.signals = _TestdataSignals()  # created here, so it lives in the gui thread
+
+    def run(self):
+        tbl_list = []
+        text_list = []
+        step = max(1, len(self.test_set) // self.progress_steps)
+        try:
+            for i, entry in enumerate(self.test_set, start=1):
+                temp = self.spcht.process_data(entry, self.subject)
+                if isinstance(temp, list):
+                    entry_id = entry.get('id', "Unknown ID")
+                    text_list.append(f"\n=== {entry_id} - {self.descriptions.get(entry_id, 'Ohne Name')} ===\n")
+                    tbl_list.extend(temp)
+                    text_list.extend(map(SpchtUtility.quickSparqlEntry, temp))
+                if i % step == 0:
+                    self.signals.progress.emit(i)
+        except Exception as e:  # probably an AttributeError but i actually cant know, so we cast the WIDE net
+            self.signals.processed.emit((self, None, None, e))
+            return
+        self.signals.processed.emit((self, tbl_list, text_list, None))
+
+
 class SpchtChecker(QMainWindow, SpchtMainWindow):
     """
     Gui for the Spcht Checker & Builder, as this is a rather big mess read further to get some thoughts behind the
@@ -214,14 +335,21 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        # * condensly generates the names for SpchtView Headers
-        self.node_headers = [{'key': x, 'header': i18n[f'col_{x}']} for x in SpchtBuilder.default_curated_keys]
+        self.node_headers = curated_node_headers()
+        # appdirs might ask the registry for this, once is enough for loading and every save
+        self.settings_path = Path(appdirs.user_config_dir(__appname__, __appauthor__, roaming=True)) / "user_settings.json"
         self.spcht_builder = None   # the builder upon all SpchtBuilder activity is based on
         self.active_spcht_node = None  # the current, in the node view openend SpchtNode
         self.active_data_tables = {}  # additional data that cannot be easily displayed in the view
         self.data_cache = None  # repository of data an example Spcht can work upon
+        self.data_cache_index = (None, {})  # data cache and its {key: {value: first index}} for the search
+        self.explorer_filled = (None, None)  # data and columns the explorer currently shows
+        self.spcht_load_job = None  # spcht descriptor that is currently read in the background
+        self.testdata_job = None  # test data that is currently processed in the background
         self.active_data = None   # the one entry that is currently active to work upon
         self.active_data_index = 0  # index in the datacache of the current data
+        self.marc21_cache = (None, None)  # last decoded fullrecord and its marc21 dictionary
+        self.spcht_computed = (None, None)  # record and node the explorer currently shows the results of
 
         # governs Quality of Life Features:
         self.META_unsaved = False  # nodes were altered but not yet saved to a file
@@ -239,15 +367,15 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
         self.utlSetupNodeTabConstants()
 
         # various
-        self.console.insertPlainText(time_log(f"Init done, program started"))
-        self.console.insertPlainText(f"Working Directory: {os.getcwd()}\n")
         # self.setupLogging()  # plan was to get logging into the console widget but i am too stupid
 
         self.mthLayoutCenter()
 
         # * Savegames
         self.lineeditstyle = self.exp_tab_node_field.styleSheet()  # this is probably a horrible idea
-        self.console.insertPlainText(f"Time for init: {time.time()-self.time0:.2f}\n")
+        self.utlConsoleLog(time_log(f"Init done, program started"),
+                           f"Working Directory: {os.getcwd()}\n",
+                           f"Time for init: {time.time()-self.time0:.2f}\n")
 
     def closeEvent(self, event):
         if self.META_unsaved:
@@ -403,11 +531,9 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
         #logging.warning("i think this isnt working at all, sad times")
 
     def loadUserSettings(self):
-        setting_folder = appdirs.user_config_dir(__appname__, __appauthor__, roaming=True)
         save_data = {}
         try:
-            with open(os.path.join(setting_folder, "user_settings.json"), "r") as save:
-                save_data = json.load(save)
+            save_data = load_json_mapped(self.settings_path)
         except FileNotFoundError:
             logging.warning("No 'savegame' file found, might be the first start, in this case this is normal")
         except json.decoder.JSONDecodeError as e:
@@ -419,13 +545,11 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
         for element in self.node_headers:
             if element['key'] not in self.tabview_active_columns:
                 self.tabview_active_columns[element['key']] = True
-        self.console.insertPlainText(f"Loaded {len(save_data)} settings from {os.path.join(setting_folder,'user_settings.json')}\n")
+        self.utlConsoleLog(f"Loaded {len(save_data)} settings from {self.settings_path}\n")
 
     def utlSaveUserSettings(self):
-        save_path = appdirs.user_config_dir(__appname__,__appauthor__, roaming=True)
-        savegame = Path(save_path)
-        savegame.mkdir(parents=True, exist_ok=True)
-        savegame = savegame / "user_settings.json"  # i am actually amazed that path just uses the divide function for this
+        savegame = self.settings_path
+        savegame.parent.mkdir(parents=True, exist_ok=True)
         # ! congregating data
         blacklist = self.explorer_filter_behaviour.isChecked()
         field_filter = self.explorer_field_filter.text()
@@ -449,25 +573,53 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
     def actSpchtLoadRetry(self):
         self.mthLoadSpcht(self.linetext_spcht_filepath.displayText())
 
-    def mthLoadSpcht(self, path_To_File):
-        try:
-            with open(path_To_File, "r") as file:
-                spcht_data = json.load(file)
-                status, output = SpchtUtility.schema_validation(spcht_data)
-        except json.decoder.JSONDecodeError as e:
-            self.console.insertPlainText(time_log(f"JSON Error: {str(e)}\n"))
+    def mthLoadSpcht(self, path_To_File, followup=None):
+        """
+        Starts loading a spcht descriptor, reading and validation run in the background, mthSpchtLoaded takes over
+        once that is done
+
+        :param str path_To_File: path to a spcht descriptor file
+        :param followup: callable without arguments that runs after the file was handled, successful or not
+        :return: nothing
+        :rtype: None
+        """
+        job = SpchtLoadJob(path_To_File, followup)
+        if self.spcht_load_job is not None:  # the replaced job gets dropped, what was supposed to follow it still has to
+            job.followups[:0] = self.spcht_load_job.followups
+        job.signals.loaded.connect(self.mthSpchtLoaded)  # bound to the window, therefore queued into the gui thread
+        self.spcht_load_job = job  # only the latest request gets displayed
+        self.utlWriteStatus("Loading spcht descriptor file")
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    def mthSpchtLoaded(self, result: tuple):
+        job, path_To_File, spcht_data, status, output, error, followups = result
+        if job is not self.spcht_load_job:  # another file was requested in the meantime and took over the followups
+            return
+        self.spcht_load_job = None
+        self.mthSpchtLoadedResult(path_To_File, spcht_data, status, output, error)
+        for followup in followups:
+            followup()
+
+    def mthSpchtLoadedResult(self, path_To_File, spcht_data, status, output, error):
+        if isinstance(error, json.decoder.JSONDecodeError):
+            self.utlConsoleLog(time_log(f"JSON Error: {str(error)}\n"))
             self.utlWriteStatus("Json error while loading Spcht")
             self.actToggleTriState(0)
             return None
-        except FileNotFoundError as e:
-            self.console.insertPlainText(time_log(f"File not Found: {str(e)}\n"))
+        if isinstance(error, FileNotFoundError):
+            self.utlConsoleLog(time_log(f"File not Found: {str(error)}\n"))
             self.utlWriteStatus("Spcht file could not be found")
             self.actToggleTriState(0)
             return None
+        if error is not None:  # no permission, a folder, broken encoding, failing validation..
+            self.utlConsoleLog(time_log(f"Error while loading Spcht [{error.__class__.__name__}]: {error}\n"))
+            self.utlWriteStatus("Spcht file could not be loaded")
+            self.actToggleTriState(0)
+            return None
 
         if status:
             if not self.taube.load_descriptor_file(path_To_File):
-                self.console.insertPlainText(time_log(
+                self.utlConsoleLog(time_log(
                     f"Unknown error while loading SPCHT, this is most likely something the checker engine doesnt account for, it might be 'new'\n"))
                 self.utlWriteStatus("Unexpected kind of error while loading Spcht")
                 return False
@@ -482,27 +634,29 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
             self.mthFillNodeView(self.spcht_builder.displaySpcht())
             self.explorer_toolbox.setCurrentIndex(1)
         else:
-            self.console.insertPlainText(time_log(f"SPCHT Schema Error: {output}\n"))
+            self.utlConsoleLog(time_log(f"SPCHT Schema Error: {output}\n"))
             self.utlWriteStatus("Loading of spcht failed")
             self.actToggleTriState(0)
             return None
 
     def mthPopulateTreeviewWithSpcht(self):
-        i = 0
         # populate views
         if self.spchttree_view_model.hasChildren():
             self.spchttree_view_model.removeRows(0, self.spchttree_view_model.rowCount())
-        for each in self.taube:
-            i += 1
+        tree_rows = []
+        for i, each in enumerate(self.taube, start=1):
             tree_row = QStandardItem(each.get('name', f"Element #{i}"))
             SpchtChecker.mthPopulateTreeviewRecursion(tree_row, each)
             tree_row.setEditable(False)
-            self.spchttree_view_model.appendRow(tree_row)
-            self.treeview_main_spcht_data.setFirstColumnSpanned(i - 1, self.treeview_main_spcht_data.rootIndex(), True)
+            tree_rows.append(tree_row)
+        # * one insertion for all nodes, the view lays out once, spanning needs the rows to exist first
+        self.spchttree_view_model.invisibleRootItem().appendRows(tree_rows)
+        root_index = self.treeview_main_spcht_data.rootIndex()
+        for row in range(len(tree_rows)):
+            self.treeview_main_spcht_data.setFirstColumnSpanned(row, root_index, True)
 
     @staticmethod
     def mthPopulateTreeviewRecursion(parent, node):
-        info = ""
         if node.get('type') == "mandatory":
             col0 = QStandardItem("!!!")
             col0.setToolTip("This field is mandatory")
@@ -511,35 +665,23 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
         col1 = QStandardItem(node.get('predicate', ""))
         col1.setToolTip(node.get('predicate', ""))
         col2 = QStandardItem(node.get('source'))
-        fields = node.get('field', "") + " |"
+        fields = node.get('field', "")
         if 'alternatives' in node:
-            fields += " Alts: "
-            for each in node['alternatives']:
-                fields += f"{each}, "
-        col3 = QStandardItem(fields[:-2])
-        col3.setToolTip(fields[:-2])
+            fields = f"{fields} | Alts: {', '.join(map(str, node['alternatives']))}"
+        col3 = QStandardItem(fields)
+        col3.setToolTip(fields)
         # other fields
-        additionals = ["append", "prepend", "cut", "replace", "match", "joined_field"]
-        for each in additionals:
-            if each in node:
-                info += f"{node[each]}; "
-        col5 = QStandardItem(info[:-2])
-        col5.setToolTip(info[:2])
-        # comments
-        commentlist = []
-        for each in node.keys():
-            finding = re.match(r"(?i)^(comment).*$", each)
-            if finding is not None:
-                commentlist.append(finding.string)
-        commentText = ""
-        commentBubble = ""
-        for each in commentlist:
-            commentText += node[each] + ", "
-            commentBubble += node[each] + "\n"
-        col6 = QStandardItem(commentText[:-2])
-        col6.setToolTip(commentBubble[:-1])
-        disableEdits(col0, col1, col2, col3, col5, col6)
-        parent.appendRow([col0, col1, col2, col3, col5, col6])
+        info = "; ".join(str(node[each]) for each in _TREE_ADDITIONALS if each in node)
+        col5 = QStandardItem(info)
+        col5.setToolTip(info)
+        # comments, any case of 'comment...'
+        comments = [node[each] for each in node.keys() if each[:7].lower() == "comment"]
+        col6 = QStandardItem(", ".join(comments))
+        col6.setToolTip("\n".join(comments))
+        row = [col0, col1, col2, col3, col5, col6]
+        for each in row:
+            each.setEditable(False)
+        parent.appendRow(row)
         if 'fallback' in node:
             SpchtChecker.mthPopulateTreeviewRecursion(parent, node['fallback'])
 
@@ -549,14 +691,10 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
         predicates = self.taube.get_node_predicates()
         self.lst_fields_model.clear()
         self.lst_graphs_model.clear()
-        for each in fields:
-            tempItem = QStandardItem(each)
-            tempItem.setEditable(False)
-            self.lst_fields_model.appendRow(tempItem)
-        for each in predicates:
-            tempItem = QStandardItem(each)
-            tempItem.setEditable(False)
-            self.lst_graphs_model.appendRow(tempItem)
+        for model, texts in ((self.lst_fields_model, fields), (self.lst_graphs_model, predicates)):
+            items = [QStandardItem(each) for each in texts]
+            disableEdits(*items)
+            model.invisibleRootItem().appendRows(items)  # one insertion instead of one per line
 
     def actToggleTriState(self, status=0):
         toggleTexts = ["[1/3] Console", "[2/3] View", "[3/3]Tests", "Explorer"]
@@ -597,24 +735,13 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
             return []
         all_fields = set()
         for _, block in enumerate(data):
+            # * the walk runs once per loaded data set, so each block's keys are merged in one go, not remembered
             if not deepdive:
-                for key in block.keys():
-                    all_fields.add(key)
+                all_fields.update(block.keys())
             else:  # methods for arbitrary data
-                for each in data_object_keys(block):
-                    all_fields.add(each)
+                all_fields.update(data_object_keys(block))
             if 'fullrecord' in block and marc21:
-                temp_marc = SpchtUtility.marc2list(block['fullrecord'])
-                for main_key, top_value in temp_marc.items():
-                    if isinstance(top_value, list):
-                        for param_list in top_value:
-                            for sub_key in param_list:
-                                all_fields.add("{main_key}:{sub_key}")
-                                all_fields.add(f"{main_key:03d}:{sub_key}")
-                    elif isinstance(top_value, dict):
-                        for sub_key in top_value:
-                            all_fields.add(f"{main_key}:{sub_key}")
-                            all_fields.add(f"{main_key:03d}:{sub_key}")  # i think this is faster than if-ing my way through
+                all_fields.update(marc_field_keys(block['fullrecord']))
             if _ > 100:
                 # ? having halt conditions like this always seems arbitrary but i really struggle to imagine how much more
                 # ? unique keys one hopes to get after 100 entries. On my fairly beefy machine the processing for 500
@@ -629,14 +756,14 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
             return None
 
         try:
-            with open(path_to_file, "r") as file:
-                test_data = json.load(file)
+            # * solr dumps can be several megabytes, mapped and parsed by orjson if available
+            test_data = load_json_mapped(path_to_file)
         except FileNotFoundError:
             self.utlWriteStatus("Loading of example Data file failed.")
             return False
         except json.JSONDecodeError as e:
             self.utlWriteStatus(f"Example data contains json errors: {e}")
-            self.console.insertPlainText(time_log(f"JSON Error in Example File: {str(e)}\n"))
+            self.utlConsoleLog(time_log(f"JSON Error in Example File: {str(e)}\n"))
             return False
         if test_data:
             self.data_cache = handle_variants(test_data)
@@ -647,7 +774,7 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
                 self.mthSetWorkableTestData(path_to_file, test_data)
                 self.utlWriteStatus("Test loaded, unusal format, data for LiveSpcht useable bot not exploreable")
             else:
-                self.console.insertPlainText(f"Loading of file {path_to_file} failed, most likely an unsupported format\n")
+                self.utlConsoleLog(f"Loading of file {path_to_file} failed, most likely an unsupported format\n")
 
         if graph_prompt:
             graphtext = self.linetext_subject_prefix.displayText()
@@ -668,9 +795,7 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
         self.active_data_index = 0
         self.explorer_linetext_search.setPlaceholderText(f"{1} / {len(data)}")
         self.mthFillExplorer(data)
-        temp_model = QStandardItemModel()
-        [temp_model.appendRow(QStandardItem(x)) for x in self.mthGatherAvailableFields(marc21=True)]
-        self.field_completer.setModel(temp_model)
+        self.field_completer_model.setStringList(self.mthGatherAvailableFields(marc21=True))
         self.explorer_field_filter.setDisabled(False)
         self.explorer_field_filter_helper.setDisabled(False)
         self.explorer_filter_behaviour.setDisabled(False)
@@ -702,10 +827,8 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
         self.active_data = data[0]
         self.active_data_index = 0
         self.explorer_linetext_search.setPlaceholderText(f"{1} / {len(data)}")
-        temp_model = QStandardItemModel()
-        [temp_model.appendRow(QStandardItem(x)) for x in self.mthGatherAvailableFields(data, marc21=True, deepdive=True)]
-        self.field_completer.setModel(temp_model)
-        self.explorer_arbitrary_data.setText(json.dumps(data, indent=3))
+        self.field_completer_model.setStringList(self.mthGatherAvailableFields(data, marc21=True, deepdive=True))
+        self.explorer_arbitrary_data.setText(pretty_json(data))  # can be the whole file, orjson if available
 
         if self.active_spcht_node:
             temp = self.mthCreateTempSpcht()
@@ -713,28 +836,31 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
 
     def actRetryTestdata(self):
         if self.data_cache:
-            self.mthLoadSpcht(self.linetext_spcht_filepath.displayText())
-            self.actProcessTestdata(self.str_testdata_filepath.displayText(), self.linetext_subject_prefix.displayText())
+            self.mthLoadSpcht(self.linetext_spcht_filepath.displayText(),
+                              lambda: self.actProcessTestdata(self.str_testdata_filepath.displayText(),
+                                                              self.linetext_subject_prefix.displayText()))
         # its probably bad style to directly use interface element text
 
     def actProcessTestdata(self, filename, subject):
+        if self.spcht_load_job is not None:  # the job would share self.taube with a descriptor that is about to replace it
+            self.spcht_load_job.followups.append(lambda: self.actProcessTestdata(filename, subject))
+            return True  # queued, runs as soon as the descriptor is in place
         debug_dict = {}  # TODO: loading of definitions
         basePath = Path(filename)
         descriPath = os.path.join(f"{basePath.parent}", f"{basePath.stem}.descri{basePath.suffix}")
         print("Additional description path:",descriPath)
         # the ministry for bad python hacks presents you this path thingy, pathlib has probably something better i didnt find in 10 seconds of googling
         try:
-            with open(descriPath) as file:  # complex file operation here
-                temp_dict = json.load(file)
-                if isinstance(temp_dict, dict):
-                    code_green = 1
-                    for key, value in temp_dict.items():
-                        if not isinstance(key, str) or not isinstance(value, str):
-                            self.utlWriteStatus("Auxilliary data isnt in expected format")
-                            code_green = 0
-                            break
-                    if code_green == 1:
-                        debug_dict = temp_dict
+            temp_dict = load_json_mapped(descriPath)  # complex file operation here
+            if isinstance(temp_dict, dict):
+                code_green = 1
+                for key, value in temp_dict.items():
+                    if not isinstance(key, str) or not isinstance(value, str):
+                        self.utlWriteStatus("Auxilliary data isnt in expected format")
+                        code_green = 0
+                        break
+                if code_green == 1:
+                    debug_dict = temp_dict
         except FileNotFoundError:
             self.utlWriteStatus("No auxilliary data has been found")
             pass  # nothing happens
@@ -742,49 +868,57 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
             self.utlWriteStatus("Loading of auxilliary testdata failed due a json error")
             pass  # also okay
         # loading debug data from debug dict if possible
-        time_process_start = datetime.now()
-
-        tbl_list = []
-        text_list = []
         thetestset = handle_variants(self.data_cache)
-        self.mthProgressMode(True)
+        self.mthProgressMode(True)  # also takes away the load buttons, no new spcht can be loaded while the job runs
         self.processBar.setMaximum(len(thetestset))
-        i = 0
-        for entry in thetestset:
-            i += 1
-            self.processBar.setValue(i)
-            try:
-                temp = self.taube.process_data(entry, subject)
-            except Exception as e:  # probably an AttributeError but i actually cant know, so we cast the WIDE net
-                self.mthProgressMode(False)
-                self.utlWriteStatus(f"SPCHT interpreting encountered an exception {e}")
-                return False
-            if isinstance(temp, list):
-                text_list.append(
-                "\n=== {} - {} ===\n".format(entry.get('id', "Unknown ID"), debug_dict.get(entry.get('id'), "Ohne Name")))
-                for each in temp:
-                    tbl_list.append(each)
-                    tmp_sparql = SpchtUtility.quickSparqlEntry(each)
-                    text_list.append(tmp_sparql)
-        # txt view
-        self.txt_tabview.clear()
-        for each in text_list:
-            self.txt_tabview.insertPlainText(each)
-        # table view
-        if self.mdl_tbl_sparql.hasChildren():
-            self.mdl_tbl_sparql.removeRows(0, self.mdl_tbl_sparql.rowCount())
-        for each in tbl_list:
-            col0 = QStandardItem(str(each.subject))
-            col1 = QStandardItem(str(each.predicate))
-            col2 = QStandardItem(str(each.sobject))
-            disableEdits(col0, col1, col2)
-            self.mdl_tbl_sparql.appendRow([col0, col1, col2])
+        self.processBar.setValue(0)
+        job = TestdataJob(self.taube, thetestset, subject, debug_dict)
+        job.signals.progress.connect(self.processBar.setValue)
+        job.signals.processed.connect(self.mthTestdataProcessed)
+        self.testdata_job = job
+        QtCore.QThreadPool.globalInstance().start(job)
+        return True
+
+    def mthTestdataProcessed(self, result: tuple):
+        job, tbl_list, text_list, error = result
+        if job is not self.testdata_job:
+            return
+        self.testdata_job = None
+        if error is not None:
+            self.mthProgressMode(False)
+            self.utlWriteStatus(f"SPCHT interpreting encountered an exception {error}")
+            return False
+        # txt view, one document for all of it
+        self.txt_tabview.setPlainText("".join(text_list))
+        # table view, every row is announced at once and filled afterwards, the view lays out its rows only once
+        sparql_model = self.mdl_tbl_sparql
+        self.tbl_tabview.setUpdatesEnabled(False)
+        sparql_model.setRowCount(0)
+        sparql_model.setRowCount(len(tbl_list))
+        for row, each in enumerate(tbl_list):
+            for column, text in enumerate((each.subject, each.predicate, each.sobject)):
+                item = QStandardItem(str(text))
+                item.setEditable(False)
+                sparql_model.setItem(row, column, item)
+        self.tbl_tabview.setUpdatesEnabled(True)
         self.actToggleTriState(2)
-        time3 = datetime.now()-time_process_start
+        time3 = datetime.now()-job.started
         self.utlWriteStatus(f"Testdata processing finished, took {delta_time_human(microseconds=time3.microseconds)}")
         self.mthProgressMode(False)
         return True
 
+    def utlConsoleLog(self, *lines: str):
+        """
+        Appends text to the end of the console, all given lines are written as one edit so the console only lays
+        itself out once instead of once per line
+
+        :param str lines: text that gets written, line breaks have to be part of it
+        """
+        cursor = self.console.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText("".join(lines))
+        self.console.setTextCursor(cursor)  # keeps the newest line in view
+
     def utlWriteStatus(self, text):  # criminally underutilized
         self.notifybar.showMessage(time_log(text, time_string="%H:%M:%S", spacer=" ", end=""))
 
@@ -812,7 +946,7 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
         for row in range(element.rowCount()):
             if element.child(row, 1).text().strip():
                 spcht[element.child(row, 0).text()] = element.child(row, 1).text().strip()
-        self.explorer_spcht_result.insertPlainText(json.dumps(spcht, indent=2) )
+        self.explorer_spcht_result.insertPlainText(pretty_json(spcht))
         self.explorer_spcht_result.setFont(self.FIXEDFONT)
         if self.data_cache:
             vogl = Spcht()
@@ -822,8 +956,7 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
                 result = vogl._recursion_node(spcht)
                 if result:
                     logging.debug(result)
-                    for each in result:
-                        self.explorer_spcht_result.insertPlainText(str(each))
+                    self.explorer_spcht_result.setPlainText("".join(str(each) for each in result))
             except Exception as e:
                 error = e.__class__.__name__
                 error += f"\n{e}"
@@ -831,7 +964,7 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
 
     def actExecDelayedFieldChange(self):
         if self.data_cache:
-            self.input_timer.start(2000)
+            self.input_timer.start()
 
     def mthExecDelayedFieldChange(self):
         if self.data_cache:
@@ -886,8 +1019,11 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
         para['wt'] = "json"
         para['rows'] = para.get('rows', 10)
         para['start'] = para.get('start', 0)
-        str_response = local_tools.load_remote_content(url, para)
-        dict_response = local_tools.test_json(str_response)
+        response = local_tools.load_remote_content(url, para, response_type=2)
+        if response is None:  # connection failed, already logged
+            return None
+        # * solr answers json in utf-8, parsing the raw bytes spares requests guessing and decoding the text first
+        dict_response = local_tools.test_json(response.content)
         if not dict_response:
             return None
         return local_tools.solr_handle_return(dict_response)
@@ -895,10 +1031,8 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
     def actFieldFilterHelper(self):
         all_fields = set()
         if self.data_cache:
-            for line in self.data_cache:
-                for key in line:
-                    if key != "fullrecord":  # ! TODO: do not make fullrecord static text
-                        all_fields.add(key)
+            all_fields = set().union(*(line.keys() for line in self.data_cache))
+            all_fields.discard("fullrecord")  # ! TODO: do not make fullrecord static text
         filtering = self.explorer_field_filter.text()
         if not filtering:
             field_filter = []
@@ -911,41 +1045,43 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
     def mthFillExplorer(self, data):
         # * Check if filter is elegible
 
-        all_keys = set()
-        for line in data:
-            for key in line:
-                if key != "fullrecord":  # ! TODO: do not make fullrecord static text
-                    all_keys.add(key)
+        all_keys = set().union(*(line.keys() for line in data))  # the keys views get merged without a python loop
+        all_keys.discard("fullrecord")  # ! TODO: do not make fullrecord static text
         filtering = self.explorer_field_filter.text()
         if filtering:
             fields = [x.strip() for x in filtering.split(",")]
             if self.explorer_filter_behaviour.isChecked():
-                all_keys = [y for y in all_keys if y not in fields]
+                all_keys = all_keys.difference(fields)
             else:
-                all_keys = [y for y in fields if y in all_keys]
-        fixed_keys = dict.fromkeys(sorted(all_keys, key=lambda x: x.lower()), None)
-        logging.debug(f"_fill_explorer: fixed_keys: {fixed_keys}")
-
-        data_model = QStandardItemModel()
-        data_model.setHorizontalHeaderLabels([x for x in fixed_keys.keys()])
+                all_keys = dict.fromkeys(y for y in fields if y in all_keys)  # a field typed twice is still one column
+        columns = sorted(all_keys, key=str.lower)
+        logging.debug(f"_fill_explorer: columns: {columns}")
+        # * a filter edit that ends up with the very same columns, like an added space, changes nothing to display
+        if self.explorer_filled[0] is data and self.explorer_filled[1] == columns:
+            return
+        self.explorer_filled = (data, columns)
 
-        for vertical, line in enumerate(data):
-            data_model.setVerticalHeaderItem(vertical, QStandardItem(str(vertical)))
-            for horizontal, a_key in enumerate(fixed_keys.keys()):
+        data_model = self.explorer_dictionary_model  # the view keeps its model, only the content is swapped
+        self.explorer_dictionary_treeview.setUpdatesEnabled(False)  # no repaint for every single row
+        data_model.clear()
+        data_model.setHorizontalHeaderLabels(columns)
+        # * every row goes in as a whole instead of cell by cell
+        for line in data:
+            row = []
+            for a_key in columns:
                 text = ""
                 if a_key in line:
-                    if isinstance(line[a_key], list):
-                        schreib = ""
-                        text = QStandardItem(f"[]{line[a_key][0]}")
-                        for each in line[a_key]:
-                            schreib += f"{each}\n"
-                            text.appendRow(QStandardItem(each))
-                        text = schreib
+                    value = line[a_key]
+                    if isinstance(value, list):
+                        text = "".join(f"{each}\n" for each in value)
                     else:
-                        text = str(line[a_key])
-                data_model.setItem(vertical, horizontal, QStandardItem(text))
-                data_model.setData(data_model.index(vertical, horizontal), QtCore.Qt.AlignTop, QtCore.Qt.TextAlignmentRole)
-        self.explorer_dictionary_treeview.setModel(data_model)
+                        text = str(value)
+                item = QStandardItem(text)
+                item.setTextAlignment(QtCore.Qt.AlignTop)
+                row.append(item)
+            data_model.appendRow(row)
+        data_model.setVerticalHeaderLabels([str(vertical) for vertical in range(len(data))])
+        self.explorer_dictionary_treeview.setUpdatesEnabled(True)
 
     def test_button(self):
         dlg = ListDialogue("Testtitle", "Do Stuff", headers=["key", "mapping"], init_data={"exe": "excecutor", "rtf": "rich text"}, parent=self)
@@ -959,19 +1095,17 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
             find_string = str(self.active_data_index + 1 + int(find_string[1:]))  # this is so dirty
         elif find_string == "-10" or find_string == "-1":
             find_string = str(self.active_data_index + 1 - int(find_string[1:]))  # this is so dirty
-        if re.search(r"^\w*:\w+$", find_string):  # search string
+        if ":" in find_string and _SEARCH_KEY.match(find_string):  # search string
             key, value = find_string.split(":")
             key = key.strip()
             value = value.strip()
             if key.strip() != "":  # key: value search
-                for _, repo in enumerate(self.data_cache):
-                    if key in repo:
-                        if repo[key] == value:
-                            self.active_data = self.data_cache[_]
-                            self.active_data_index = _
-                            self.explorer_linetext_search.setPlaceholderText(f"{_ + 1} / {len(self.data_cache)}")
-                            self.explorer_linetext_search.setText("")
-                            break
+                _ = self.utlFindDataCacheIndex(key, value)
+                if _ is not None:
+                    self.active_data = self.data_cache[_]
+                    self.active_data_index = _
+                    self.explorer_linetext_search.setPlaceholderText(f"{_ + 1} / {len(self.data_cache)}")
+                    self.explorer_linetext_search.setText("")
             else:  # value only search
                 pass
         elif SpchtUtility.is_int(find_string):
@@ -990,6 +1124,30 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
         if temp:
             self.mthComputeSpcht(temp)
 
+    def utlFindDataCacheIndex(self, key: str, value: str):
+        """
+        Finds the first entry of the data cache that has exactly value in key. The first search for a key walks the
+        data once and remembers where every value is, any further search for that key is a simple lookup. A newly
+        loaded data cache starts from scratch
+
+        :param str key: a key of the data entries
+        :param str value: the searched text
+        :return: index of the first matching entry in the data cache or None
+        :rtype: int or None
+        """
+        cache, index = self.data_cache_index
+        if cache is not self.data_cache:
+            index = {}
+            self.data_cache_index = (self.data_cache, index)
+        if key not in index:
+            positions = {}
+            for position, repo in enumerate(self.data_cache):
+                entry = repo.get(key)
+                if isinstance(entry, str):  # nothing else can be equal to the searched text
+                    positions.setdefault(entry, position)
+            index[key] = positions
+        return index[key].get(value)
+
     def mthFillNodeView(self, builder_display_data):
         floating_model = QStandardItemModel()
         floating_model.setHorizontalHeaderLabels([x['header'] for x in self.node_headers])
@@ -1137,6 +1295,9 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
             spcht_descriptor = self.spcht_builder.compileNodeReference(self.active_spcht_node)
         if not self.active_data or not spcht_descriptor:
             return
+        # * the debounced node edits often end up with the very same node, like a space that gets stripped anyway
+        if self.spcht_computed[0] is self.active_data and self.spcht_computed[1] == spcht_descriptor:
+            return
         fake_spcht = {
             "id_source": "dict",
             "id_field": "id",
@@ -1151,34 +1312,48 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
             element0.pop("fullrecord")
         habicht._raw_dict = element0
         if 'fullrecord' in self.active_data:
-            habicht._m21_dict = SpchtUtility.marc2list(self.active_data['fullrecord'])
-        self.explorer_filtered_data.setRowCount(len(used_fields))
-        self.explorer_filtered_data.setColumnCount(2)
-        self.explorer_filtered_data.setHorizontalHeaderLabels(["Key", "Value"])
+            fullrecord = self.active_data['fullrecord']
+            # * every change of the node computes the same record again, the record itself is the key
+            if self.marc21_cache[0] is not fullrecord:
+                self.marc21_cache = (fullrecord, SpchtUtility.marc2list(fullrecord))
+            habicht._m21_dict = self.marc21_cache[1]
+        table = self.explorer_filtered_data
+
+        def put(row: int, column: int, text: str):  # cells that already exist only get a new text
+            item = table.item(row, column)
+            if item is None:
+                table.setItem(row, column, QTableWidgetItem(text))
+            else:
+                item.setText(text)
+
+        # * rows are written by index, sorting in between would move them around, repaints wait until the end
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.setRowCount(len(used_fields))
+        table.setColumnCount(2)
+        table.setHorizontalHeaderLabels(["Key", "Value"])
         for i, key in enumerate(used_fields):  # lists all used fields
             if key == "fullrecord":
                 continue
-            self.explorer_filtered_data.setItem(i, 0, QTableWidgetItem(key))
+            put(i, 0, key)
             if key in element0:
-                self.explorer_filtered_data.setItem(i, 1, QTableWidgetItem(str(element0[key])))
-            elif re.search(r"^[0-9]{1,3}:\w+$", key):  # filter for marc
+                put(i, 1, str(element0[key]))
+            elif ":" in key and _MARC_KEY.match(key):  # filter for marc
                 value = habicht.extract_dictmarc_value({'source': 'marc', 'field': key}, raw=True)
-                if value:
-                    self.explorer_filtered_data.setItem(i, 1, QTableWidgetItem(str(value)))
-                self.explorer_filtered_data.setItem(i, 1, QTableWidgetItem("::MISSING::"))
-            elif re.search(r"^((\w*)>)+\w+$", key):  # source tree, contains at least one 'word' + '>', otherwise it might be dict
+                put(i, 1, str(value) if value else "::MISSING::")
+            elif ">" in key and _TREE_KEY.match(key):  # source tree
                 try:
                     value = habicht.extract_dictmarc_value({'source': 'tree', 'field': key}, raw=True)
-                    if value:
-                        self.explorer_filtered_data.setItem(i, 1, QTableWidgetItem(str(value)))
-                    else:
-                        self.explorer_filtered_data.setItem(i, 1, QTableWidgetItem("::MISSING::"))
+                    put(i, 1, str(value) if value else "::MISSING::")
                 except TypeError as e:
                     print(f"TypeErorr: {e}")
             else:
-                self.explorer_filtered_data.setItem(i, 1, QTableWidgetItem("::MISSING::"))
-        self.explorer_filtered_data.resizeColumnToContents(0)
-        self.explorer_filtered_data.horizontalHeader().setStretchLastSection(True)
+                put(i, 1, "::MISSING::")
+        table.setSortingEnabled(sorting)
+        table.setUpdatesEnabled(True)
+        table.resizeColumnToContents(0)
+        table.horizontalHeader().setStretchLastSection(True)
         self.explorer_spcht_result.setText("")
         try:
             processsing_results = habicht._recursion_node(spcht_descriptor)
@@ -1189,17 +1364,15 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
             processsing_results = ""
             self.explorer_spcht_result.setText(f"TypeError: {e}\n")
         if processsing_results:
-            lines = ""
-            for each in processsing_results:
-                lines += f"{each.predicate} - {each.sobject}\n"
-            self.explorer_spcht_result.setText(lines)
+            self.explorer_spcht_result.setText("".join(f"{each.predicate} - {each.sobject}\n" for each in processsing_results))
         else:
             self.explorer_spcht_result.append("::NORESULT::")
+        self.spcht_computed = (self.active_data, spcht_descriptor)
 
     def actDelayedSpchtComputing(self):
         self.META_changed = True
         if self.active_data:
-            self.spcht_timer.start(1000)
+            self.spcht_timer.start()
 
     def mthCreateTempSpcht(self):
         if self.active_spcht_node:
@@ -1207,7 +1380,7 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
             if temp:
                 # ? apparently to get the true temp node i need to get a new builder with the changed node so i can
                 # ? can compile accordingly to properly collapse the dependencies..
-                temp_builder = copy.deepcopy(self.spcht_builder)
+                temp_builder = self.spcht_builder.fork()
                 smp = SimpleSpchtNode(temp['name'])
                 smp.import_dictionary(temp)
                 #smp.parent = temp.get('parent', self.active_spcht_node.get('parent', ":MAIN:"))
@@ -1326,8 +1499,7 @@ class SpchtChecker(QMainWindow, SpchtMainWindow):
             print(dlg.getContent())
 
     def actShowCompleteBuilder(self):
-        builder = json.dumps(self.spcht_builder.exportDict(), indent=3)
-        dlg = JsonDialogue(builder)
+        dlg = JsonDialogue(self.spcht_builder.exportDict())
         dlg.exec_()
 
     def actSetNodeParent(self, widget: QWidget):
@@ -25,6 +25,7 @@ SOURCES = ("dict", "marc", "tree")
 SPCHT_BOOL_OPS = {"equal":"==", "eq":"==","greater":">","gr":">","lesser":"<","ls":"<",
                     "greater_equal":">=","gq":">=", "lesser_equal":"<=","lq":"<=",
                   "unequal":"!=","uq":"!=","=":"==","==":"==","<":"<",">":">","<=":"<=",">=":">=","!=":"!=","exi":"exi"}
+SPCHT_BOOL_OPS_UNIQUE = tuple(dict.fromkeys(SPCHT_BOOL_OPS.values()))  # every operator once, in order of definition
 SPCHT_BOOL_NUMBERS = [">", "<", ">=", "<="]
 
 WORK_ORDER_STATUS = ("Freshly created",  # * 0
@@ -81,6 +82,11 @@ BUILDER_SINGLE_REFERENCE = ["fallback"]
 BUILDER_LIST_REFERENCE = ["sub_nodes", "sub_data"]
 BUILDER_NON_SPCHT = ["parent", "predicate_inheritance"]  # additional convenience keys for the SimpleSpchtNodes which are not Spcht
 
+# preset of the explorer field filter when there are no saved user settings
+DEFAULT_EXPLORER_FIELD_FILTER = "spelling, barcode, rvk_path, rvk_path_str_mv, topic_facet, author_facet, institution, spellingShingle"
+# extended version for solr of the ubl, whom it might concern
+# _version_, access_facet_,author_corporate,author_corporate_role,author_sort,author_variant,barcode,barcode_de15,barcode_dech1,barcode_del152,barcode_dezi4,branch_de14,branch_de15, branch_dezi4,building,callnumber-first,callnumber-label,callnumber-raw,callnumber-search,callnumber-subject,callnumber_de14,callnumber_de15,callnumber-sort,callnumber_de15_cns_mv,callnumber_de15_ct_mv,callnumber_dech1,callnumber_del152,branch_dech1,callnumber_dezi4,collcode_dech1,collcode_dezi4,container_reference,ctrlnum,container_start_page,container_title,contents,dateSpan,de15_date,dech1_date,dewey-full,dewey-hundreds,dewey-ones,dewey-raw,dewey-sort,dewey-tens,dewey-search,era_facet,facet_912a, facet_avail,facet_de14_branch_collcode_exception,facet_local_del330, facet_scale,film_heading,finc_id_str,format_de105,format_de14, format_de15,format_del152,format_dezi4,format_finc,format_legacy_nrw,format_nrw,genre_facet,geogr_code,geogr_code_person, hierarchy_sequence, is_hierarchy_id, is_hierarchy_title, local_class_del242,local_heading_facet_dezwi2,marc028a_ct_mv,match_str,mega_collection,misc_de105,multipart_link,marc024a_ct_mv,multipart_part,multipart_set,names_id_str_mv, spelling,spellingShingle, rvk_path, rvk_path_str_mv,title_full_unstemmed, title_in_hierarchy,title_list_str,title_id_str_mv, zdb, urn, topic_facet,title_old, title_orig, title_part_str, title_short, title_sort
+
 RANDOM_NAMES = ['Trafalgar', 'Miranda', 'Kathmandu', 'Venerable', 'Crazy Horse', 'Peerless', 'Qiuxing', 'Swordfish', 'Berlin', 'Perseverance', 'Manila',
 'Nishizawa', 'Courageous', 'Mongol', 'Dubai', 'Tiger Shark', 'Atlas', 'Melbourne', 'Buffalo', 'Baghdad', 'Jubilant',
 'Galaxy', 'Cyclone', 'Vladivostok', 'Lima', 'Athens', 'Istanbul', 'Abhay', 'Mystic', 'Soobrazitelny', 'Karachi',
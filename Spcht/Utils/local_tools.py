@@ -274,13 +274,12 @@ def delta_time_human(**kwargs):
     # https://stackoverflow.com/a/11157649
     attrs = ['years', 'months', 'days', 'hours', 'minutes', 'seconds', 'microseconds']
     delta = relativedelta(**kwargs)
-    human_string = ""
+    parts = []
     for attr in attrs:
-        if getattr(delta, attr):
-            if human_string != "":
-                human_string += ", "
-            human_string += '%d %s' % (getattr(delta, attr), getattr(delta, attr) > 1 and attr or attr[:-1])
-    return human_string
+        value = getattr(delta, attr)
+        if value:
+            parts.append('%d %s' % (value, attr if value > 1 else attr[:-1]))
+    return ", ".join(parts)
 
 
 def str2sha256(text: str):
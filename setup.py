@@ -21,10 +21,21 @@
 #
 # @license GPL-3.0-only <https://www.gnu.org/licenses/gpl-3.0.en.html>
 
+import os
+
 try:
     from setuptools import setup, find_packages
 except ImportError:
     from distutils.core import setup
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+# optional, compiles the long and straight gui building code, needs Cython and a C compiler, the .py stays the source
+ext_modules = []
+if cythonize and os.environ.get("SPCHT_CYTHONIZE"):
+    ext_modules = cythonize(["Spcht/Gui/SpchtCheckerGui_interface.py"], language_level=3)
 
 with open("README.md", "r") as readme:
     long_desc = readme.read()
@@ -42,6 +53,7 @@ with open("README.md", "r") as readme:
         zip_safe=False,
         include_package_data=True,
         packages=find_packages(),
+        ext_modules=ext_modules,
         #packages=[
         #    'Spcht',
         #    'Spcht.foliotools',
@@ -101,6 +101,19 @@ class TestSpchtBuilder(unittest.TestCase):
     def test_modify(self):
         pass
 
+    def test_fork(self):
+        dummy = self._create_dummy()
+        before = dummy.compileNode("iron")
+        forked = dummy.fork()
+        forked.modify("copper", SimpleSpchtNode("brass", "iron", field="three", source="dict", predicate="wk:11"))
+        with self.subTest("Original untouched"):
+            self.assertEqual(before, dummy.compileNode("iron"))
+            self.assertEqual("iron", dummy["copper"].parent)
+            self.assertEqual("copper", dummy["zinc"].parent)
+        with self.subTest("Fork modified"):
+            self.assertEqual("brass", forked["iron"]["fallback"])
+            self.assertEqual(":UNUSED:", forked["zinc"].parent)
+
     def test_add(self):
         pass
 
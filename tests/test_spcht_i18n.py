@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# Copyright 2022 by Leipzig University Library, http://ub.uni-leipzig.de
+#                   JP Kanter, <kanter@ub.uni-leipzig.de>
+#
+# This file is part of the Spcht.
+#
+# This program is free software: you can redistribute
+# it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Spcht.  If not, see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0-only <https://www.gnu.org/licenses/gpl-3.0.en.html>
+
+import json
+import os
+import tempfile
+import unittest
+
+from Spcht.Gui.SpchtCheckerGui_i18n import Spcht_i18n
+
+
+class TestSpchtI18n(unittest.TestCase):
+
+    LANGUAGES = {
+        "title": {"en": "title", "de": "Titel"},
+        "abort": {"en": "abort"},
+        "quoted": {"en": 'a "quoted" text; with separator', "de": "zitiert"},
+        "broken": "not a dictionary"
+    }
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.language_file = os.path.join(self.folder.name, "languages.json")
+        with open(self.language_file, "w", encoding="utf-8") as languages:
+            json.dump(self.LANGUAGES, languages)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_load(self):
+        i18n = Spcht_i18n(self.language_file, language="de")
+        with self.subTest("translated"):
+            self.assertEqual(i18n['title'], "Titel")
+        with self.subTest("default language"):
+            self.assertEqual(i18n['abort'], "abort")
+        with self.subTest("unknown key"):
+            self.assertEqual(i18n['unknown'], "unknown")
+        with self.subTest("contains"):
+            self.assertIn('title', i18n)
+            self.assertNotIn('broken', i18n)
+        with self.subTest("len"):
+            self.assertEqual(len(i18n), 3)
+
+    def test_changed_file(self):
+        self.assertEqual(Spcht_i18n(self.language_file, language="de")['title'], "Titel")
+        with open(self.language_file, "w", encoding="utf-8") as languages:
+            json.dump({"title": {"de": "Überschrift"}}, languages)
+        modified = os.stat(self.language_file).st_mtime_ns + 1000000000
+        os.utime(self.language_file, ns=(modified, modified))
+        self.assertEqual(Spcht_i18n(self.language_file, language="de")['title'], "Überschrift")
+
+    def test_missing_file(self):
+        i18n = Spcht_i18n(os.path.join(self.folder.name, "nothing.json"))
+        self.assertEqual(len(i18n), 0)
+        self.assertEqual(i18n['title'], "title")
+
+    def test_csv_roundtrip(self):
+        data = {key: value for key, value in self.LANGUAGES.items() if isinstance(value, dict)}
+        csv_file = os.path.join(self.folder.name, "languages.csv")
+        new_file = os.path.join(self.folder.name, "new_languages.json")
+        with open(self.language_file, "w", encoding="utf-8") as languages:
+            json.dump(data, languages)
+        self.assertTrue(Spcht_i18n.export_csv(self.language_file, csv_file))
+        Spcht_i18n.import_csv(csv_file, new_file)
+        with open(new_file, "r", encoding="utf-8") as languages:
+            result = json.load(languages)
+        expected = {key: {"en": "", "de": "", **value} for key, value in data.items()}
+        self.assertEqual(result, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()